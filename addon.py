@@ -1,4 +1,7 @@
 import resources.lib.tripler as tripler
 
 if __name__ == '__main__':
-    result = tripler.instance.parse()
+    try:
+        result = tripler.instance.parse()
+    finally:
+        tripler.instance.shutdown()
@@ -0,0 +1,50 @@
+'''
+Time per item to build Items from the models the scrapers read off the
+recorded pages, with the memoised properties computed once and with them
+computed on every read.
+
+    python benchmarks/items.py
+'''
+import os, sys
+from unittest import mock
+
+import bs4
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from resources.lib import clock, scraper
+from resources.lib.scraper import BroadcastTrack, Event, ProgramBroadcastSegment, ScheduleItem, Scraper, memoised
+from benchmarks.timing import best
+from tests import fixtures
+
+
+# model, route whose recorded page it is read from, class of its elements
+MODELS = [
+    (ScheduleItem,            '/schedule',                       'list-view__item'),
+    (BroadcastTrack,          '/tracks/search?q=x',              'search-result'),
+    (ProgramBroadcastSegment, '/programs/prog-1/broadcasts/12',  'episode-detail__highlights-item'),
+    (Event,                   '/events',                         'card'),
+]
+
+
+def unmemoised(self, obj, owner=None):
+    return self if obj is None else self.func(obj)
+
+def elements(route, class_):
+    markup = fixtures.page(Scraper.find_by_resource_path(route).url())
+    return bs4.BeautifulSoup(markup, scraper.html_parser).findAll(class_=class_)
+
+def compare(name, build, count):
+    with mock.patch.object(memoised, '__get__', unmemoised):
+        before, expected = best(build, 50), build()
+    after = best(build, 50)
+    assert build() == expected
+    print(f'{name:<26}{count:>6}{before / count * 1000:>12.1f}{after / count * 1000:>12.1f}{1 - after / before:>8.0%}')
+
+
+if __name__ == '__main__':
+    print(f'{"model":<26}{"items":>6}{"every read":>12}{"memoised":>12}{"saved":>8}  (us/item)')
+    with clock.snapshot():
+        for model, route, class_ in MODELS:
+            found = elements(route, class_)
+            compare(model.__name__, lambda: [model(el).to_item().to_dict() for el in found], len(found))
@@ -0,0 +1,58 @@
+'''
+Times collecting a provider's fields from the recorded pages, with the
+provider's markup in the head of each: one search per pattern over the whole
+page, the PageScanner fed as the page streams in, with and without stopping
+early, and a single alternation of every pattern. `read` is the share of the
+page the scanner reads before it stops.
+
+    python benchmarks/page_scanner.py
+'''
+import os, re, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from resources.lib.scraper import PageScanner
+from benchmarks.timing import best
+from tests import fixtures
+
+
+# each takes the page as fetched, in bytes
+
+def searched(data, first, every):
+    text = data.decode()
+    found = {name: pattern.search(text) for name, pattern in first.items()}
+    found.update({name: list(pattern.finditer(text)) for name, pattern in every.items()})
+    return found
+
+def scanned(data, first, every, until=()):
+    scanner = PageScanner(first=first, every=every, until=until)
+    for pos in range(0, len(data), 16 * 1024):
+        if scanner.feed(data[pos:pos + 16 * 1024]):
+            return scanner
+    scanner.close()
+    return scanner
+
+def alternation(first, every):
+    # named groups can not repeat across alternatives, so each pattern gets its own
+    patterns = [*first.values(), *every.values()]
+    return re.compile('|'.join(
+        '(?P<_%d>%s)' % (index, re.sub(r'\(\?P<\w+>', '(?:', pattern.pattern))
+        for index, pattern in enumerate(patterns)
+    ))
+
+def alternated(data, combined):
+    return list(combined.finditer(data.decode()))
+
+
+if __name__ == '__main__':
+    print(f'{"provider":<18}{"search":>10}{"scanner":>10}{"until":>10}{"alternate":>10}   ms{"read":>8}')
+    for provider, (first, every) in fixtures.PROVIDER_SCANS.items():
+        page = fixtures.recorded_provider_page(provider).encode()
+        combined = alternation(first, every)
+        read = scanned(page, first, every, list(first)).bytes / len(page)
+        print(f'{provider:<18}'
+              f'{best(lambda: searched(page, first, every), 100):>10.2f}'
+              f'{best(lambda: scanned(page, first, every), 100):>10.2f}'
+              f'{best(lambda: scanned(page, first, every, list(first)), 100):>10.2f}'
+              f'{best(lambda: alternated(page, combined)):>10.2f}'
+              f'{read:>13.0%}')
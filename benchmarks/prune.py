@@ -0,0 +1,33 @@
+'''
+Bytes and parse time saved per route by dropping inline scripts, styles and
+svg sprites from the recorded pages, parsed with the route's PARSE_ONLY as
+soup() does. Routes with a strainer parse the page as fetched, since it
+passes over those blocks about as fast as prune() drops them.
+
+    python benchmarks/prune.py [html.parser|lxml]
+'''
+import os, sys
+
+import bs4
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from resources.lib import scraper
+from resources.lib.scraper import Scraper
+from benchmarks.timing import paired
+from tests import fixtures
+
+
+if __name__ == '__main__':
+    parser = sys.argv[1] if len(sys.argv) > 1 else scraper.html_parser
+    print(f'{"route":<34}{"bytes":>8}{"saved":>7}{"time saved":>12}{"quartiles":>16}{"faster":>8}  pruned')
+    for route in fixtures.ROUTES:
+        scraper_class = Scraper.find_by_resource_path(route)
+        parse_only = getattr(scraper_class, 'PARSE_ONLY', None)
+        markup = fixtures.page(scraper_class.url())
+        saved, low, high, faster = paired(
+            lambda: bs4.BeautifulSoup(markup, parser, parse_only=parse_only),
+            lambda: bs4.BeautifulSoup(scraper.prune(markup), parser, parse_only=parse_only),
+        )
+        print(f'{route:<34}{len(markup):>8}{1 - len(scraper.prune(markup)) / len(markup):>7.0%}'
+              f'{saved:>12.1%}{low:>8.1%}..{high:>6.1%}{faster:>8.0%}  {"no" if parse_only else "yes"}')
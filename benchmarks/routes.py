@@ -0,0 +1,23 @@
+'''
+Paths routed per second by the RouteIndex alternation and by trying each
+scraper's pattern in turn, as before it.
+
+    python benchmarks/routes.py
+'''
+import os, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from resources.lib.scraper import Scraper
+from benchmarks.timing import best
+from tests import fixtures
+
+
+if __name__ == '__main__':
+    print(f'{"paths":<24}{"linear":>12}{"index":>12}   routes/s')
+    for attribute in ('RESOURCE_PATH_PATTERN', 'WEBSITE_PATH_PATTERN'):
+        paths = fixtures.route_paths(attribute) * 10
+        index = Scraper.routes(attribute)
+        linear = best(lambda: [fixtures.linear_route(attribute, path) for path in paths])
+        indexed = best(lambda: [index.match(path) for path in paths])
+        print(f'{attribute.split("_")[0].lower():<24}{len(paths) / linear * 1000:>12.0f}{len(paths) / indexed * 1000:>12.0f}')
@@ -0,0 +1,39 @@
+import gc, random, statistics, time
+
+
+def best(func, repeat=7):
+    '''
+    Fastest of `repeat` runs of func, in milliseconds.
+    '''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+def paired(before, after, runs=100):
+    '''
+    Share of time after saves over before, as the median and the quartiles
+    of runs that time the two back to back in a random order, and the share
+    of runs where after is faster. Pairing keeps the comparison steady on a
+    machine whose speed drifts more than the difference being measured.
+    '''
+    rnd = random.Random(runs)
+    ratios = []
+    gc.disable()
+    try:
+        for _ in range(runs):
+            funcs = [before, after]
+            rnd.shuffle(funcs)
+            times = {}
+            for func in funcs:
+                start = time.perf_counter()
+                func()
+                times[func] = time.perf_counter() - start
+            ratios.append(times[after] / times[before])
+            gc.collect()
+    finally:
+        gc.enable()
+    low, median, high = statistics.quantiles(ratios, n=4)
+    return 1 - median, 1 - high, 1 - low, sum(ratio < 1 for ratio in ratios) / runs
@@ -0,0 +1,188 @@
+import hashlib, json, os, threading, time
+from collections import OrderedDict
+
+
+# max_age of results that never go stale
+NO_EXPIRY = float('inf')
+
+
+class DiskCache:
+    '''
+    Files under one directory, named by a hash of their key and removed
+    once they have not been written or used for MAX_AGE seconds.
+    '''
+
+    MAX_AGE     = 7 * 24 * 60 * 60
+    PRUNE_EVERY = 24 * 60 * 60
+
+    def __init__(self, path):
+        self.path = path
+
+    def _key(self, key):
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _write(self, filename, data):
+        tmpname = f'{filename}.{os.getpid()}.tmp'
+        with open(tmpname, 'wb') as f:
+            f.write(data)
+        os.replace(tmpname, filename)
+
+    def prune(self):
+        marker = os.path.join(self.path, '.pruned')
+        now = time.time()
+        try:
+            if now - os.path.getmtime(marker) < self.PRUNE_EVERY:
+                return
+        except OSError:
+            pass
+        try:
+            with open(marker, 'w'):
+                pass
+            for name in os.listdir(self.path):
+                filename = os.path.join(self.path, name)
+                if name != '.pruned' and now - os.path.getmtime(filename) > self.MAX_AGE:
+                    os.remove(filename)
+        except OSError:
+            pass
+
+
+class HTTPCache(DiskCache):
+    '''
+    On-disk store of response bodies alongside their ETag / Last-Modified
+    validators, so that unchanged pages can be revalidated with a 304.
+    '''
+
+    def _files(self, url):
+        key = self._key(url)
+        return os.path.join(self.path, key + '.json'), os.path.join(self.path, key + '.body')
+
+    def get(self, url):
+        metafile, bodyfile = self._files(url)
+        try:
+            with open(metafile) as f:
+                meta = json.load(f)
+            with open(bodyfile, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        if meta.get('url') != url:
+            return None, None
+        return meta, body
+
+    def validators(self, meta):
+        headers = {}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def set(self, url, headers, body):
+        meta = {
+            'url':           url,
+            'etag':          headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored':        int(time.time()),
+        }
+        if not meta['etag'] and not meta['last_modified']:
+            return
+        metafile, bodyfile = self._files(url)
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            self._write(bodyfile, body)
+            self._write(metafile, json.dumps(meta).encode())
+        except OSError:
+            return
+        self.prune()
+
+    def touch(self, url):
+        metafile, bodyfile = self._files(url)
+        try:
+            os.utime(metafile)
+            os.utime(bodyfile)
+        except OSError:
+            pass
+
+
+class ResultCache(DiskCache):
+    '''
+    JSON results by key, such as scraper results by resource path, kept in
+    a small in-memory LRU in front of one file per key. Entries carry their
+    own expiry, None for ones that never go stale. Results handed out are
+    shared and must not be modified.
+    '''
+
+    MAX_AGE     = 30 * 24 * 60 * 60
+    MEMORY_SIZE = 64
+
+    def __init__(self, path, version=''):
+        super().__init__(path)
+        # results kept by another version of the addon are never read, and age out
+        self.version = version
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _file(self, key):
+        return os.path.join(self.path, self._key(f'{self.version}:{key}') + '.json')
+
+    def _remember(self, key, expires, result):
+        with self._lock:
+            self._memory[key] = (expires, result)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_SIZE:
+                self._memory.popitem(last=False)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] is None or entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+        filename = self._file(key)
+        try:
+            with open(filename) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('key') != key or entry.get('version', '') != self.version:
+            return None
+        expires = entry.get('expires')
+        if expires is not None and expires <= now:
+            return None
+        try:
+            os.utime(filename)
+        except OSError:
+            pass
+        self._remember(key, expires, entry['result'])
+        return entry['result']
+
+    def set(self, key, result, max_age):
+        expires = None if max_age == NO_EXPIRY else time.time() + max_age
+        self._remember(key, expires, result)
+        entry = {
+            'key':     key,
+            'version': self.version,
+            'expires': expires,
+            'result':  result,
+        }
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            self._write(self._file(key), json.dumps(entry).encode())
+        except (OSError, TypeError, ValueError):
+            return
+        self.prune()
+
+
+class MediaCache(ResultCache):
+    '''
+    Album art, titles and durations from media providers, by plugin and
+    media id, which almost never change once published.
+    '''
+
+    MAX_AGE     = 90 * 24 * 60 * 60
+    MEMORY_SIZE = 1024
@@ -0,0 +1,202 @@
+import base64, http.client, io, ssl, threading, zlib
+
+from urllib.request import Request, getproxies, proxy_bypass
+from urllib.parse import unquote
+from urllib.parse import urljoin, urlsplit
+from urllib.error import URLError, HTTPError
+
+
+ENCODINGS = 'gzip, deflate'
+
+
+def content_decoder(encoding):
+    encoding = (encoding or '').strip().lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        return zlib.decompressobj(32 + zlib.MAX_WBITS)
+
+
+class Response:
+    def __init__(self, url, status, reason, headers, body):
+        self.url     = url
+        self.status  = status
+        self.reason  = reason
+        self.headers = headers
+        self.body    = body
+
+    @property
+    def code(self):
+        return self.status
+
+    def info(self):
+        return self.headers
+
+    def geturl(self):
+        return self.url
+
+    def read(self):
+        return self.body
+
+
+class HTTPClient:
+    '''
+    Keeps persistent connections open per host, so that repeated requests
+    to the same site skip the TCP and TLS handshakes. Proxies from the
+    environment are honoured as urlopen() did, tunnelling https through
+    CONNECT.
+    '''
+
+    MAX_IDLE      = 4
+    MAX_REDIRECTS = 10
+    REDIRECTS     = (301, 302, 303, 307, 308)
+    CHUNK_SIZE    = 64 * 1024
+    # only these are resent when a pooled connection turns out to be closed
+    IDEMPOTENT    = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self):
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._context = ssl.create_default_context()
+        self._proxies = getproxies()
+
+    def _proxy(self, scheme, host):
+        proxy = self._proxies.get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        parts = urlsplit(proxy if '://' in proxy else 'http://' + proxy)
+        authorization = None
+        if parts.username is not None:
+            credentials = f'{unquote(parts.username)}:{unquote(parts.password or "")}'
+            authorization = 'Basic ' + base64.b64encode(credentials.encode()).decode()
+        return parts.hostname, parts.port or 80, authorization
+
+    def _connect(self, key, timeout):
+        scheme, host, port, proxy = key
+        if proxy:
+            proxy_host, proxy_port, authorization = proxy
+            if scheme == 'https':
+                conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=self._context)
+                conn.set_tunnel(host, port, headers={'Proxy-Authorization': authorization} if authorization else None)
+                return conn
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._context)
+        else:
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key, timeout, fresh=False):
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle and not fresh else None
+        if conn is None:
+            return self._connect(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.MAX_IDLE:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _read(self, response):
+        decoder = content_decoder(response.getheader('Content-Encoding'))
+        chunks = []
+        while True:
+            chunk = response.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(decoder.decompress(chunk) if decoder else chunk)
+        if decoder:
+            chunks.append(decoder.flush())
+        return b''.join(chunks)
+
+    def _send(self, method, url, headers, data, timeout):
+        parts = urlsplit(url)
+        proxy = self._proxy(parts.scheme, parts.hostname)
+        key = (parts.scheme, parts.hostname, parts.port, proxy)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        if proxy and parts.scheme == 'http':
+            target = f'{parts.scheme}://{parts.netloc}{target}'
+            if proxy[2]:
+                headers = {**headers, 'Proxy-Authorization': proxy[2]}
+
+        # a body is never sent twice, so other methods always get a fresh connection
+        conn, reused = self._acquire(key, timeout, fresh=method not in self.IDEMPOTENT)
+        try:
+            conn.request(method, target, body=data, headers=headers)
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # the server dropped an idle connection, so retry on a fresh one
+            conn = self._connect(key, timeout)
+            conn.request(method, target, body=data, headers=headers)
+            response = conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+
+        try:
+            body = self._read(response)
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        return Response(url, response.status, response.reason, response.msg, body)
+
+    def request(self, url, data=None, headers={}, timeout=None, cookiejar=None):
+        method = 'POST' if data is not None else 'GET'
+
+        for _ in range(self.MAX_REDIRECTS + 1):
+            req = Request(url, data, headers=headers, method=method)
+            if cookiejar is not None:
+                cookiejar.add_cookie_header(req)
+            if data is not None and not req.has_header('Content-type'):
+                req.add_header('Content-type', 'application/x-www-form-urlencoded')
+            if not req.has_header('Accept-encoding'):
+                req.add_header('Accept-encoding', ENCODINGS)
+
+            try:
+                response = self._send(method, url, dict(req.header_items()), data, timeout)
+            except (OSError, http.client.HTTPException, zlib.error) as e:
+                raise URLError(e)
+
+            if cookiejar is not None:
+                cookiejar.extract_cookies(response, req)
+
+            location = response.headers.get('Location')
+            if response.status not in self.REDIRECTS or not location:
+                break
+
+            url = urljoin(url, location)
+            if response.status in (301, 302, 303) and method == 'POST':
+                method, data = 'GET', None
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(response.body))
+
+        return response
+
+
+instance = HTTPClient()
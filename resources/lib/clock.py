@@ -0,0 +1,107 @@
+import threading, time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+
+ISO_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+_now      = None
+_now_lock = threading.Lock()
+
+
+class Melbourne(tzinfo):
+    '''
+    Australia/Melbourne under the daylight saving rules in force since 2008,
+    so that local times can be worked out without loading a tz database.
+    '''
+
+    STANDARD = timedelta(hours=10)
+    DAYLIGHT = timedelta(hours=1)
+    ZERO     = timedelta(0)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def changes(year):
+        # daylight time ends on the first Sunday in April and starts on the
+        # first Sunday in October, both at 2am standard time
+        april, october = datetime(year, 4, 1, 2), datetime(year, 10, 1, 2)
+        return (
+            april   + timedelta(days=(6 - april.weekday())   % 7),
+            october + timedelta(days=(6 - october.weekday()) % 7),
+        )
+
+    def utcoffset(self, dt):
+        return self.STANDARD + self.dst(dt)
+
+    def dst(self, dt):
+        wall = dt.replace(tzinfo=None)
+        ends, starts = self.changes(wall.year)
+        # an hour repeats when daylight time ends and is skipped when it
+        # starts, within either hour fold picks the later offset
+        if wall < ends or wall >= starts + self.DAYLIGHT:
+            return self.DAYLIGHT
+        if wall < ends + self.DAYLIGHT:
+            return self.ZERO if dt.fold else self.DAYLIGHT
+        if wall >= starts:
+            return self.DAYLIGHT if dt.fold else self.ZERO
+        return self.ZERO
+
+    def tzname(self, dt):
+        return 'AEDT' if self.dst(dt) else 'AEST'
+
+    def fromutc(self, dt):
+        standard = dt.replace(tzinfo=None) + self.STANDARD
+        ends, starts = self.changes(standard.year)
+        if standard < ends or standard >= starts:
+            return (standard + self.DAYLIGHT).replace(tzinfo=self)
+        return standard.replace(tzinfo=self, fold=int(standard < ends + self.DAYLIGHT))
+
+
+melbourne = Melbourne()
+
+
+@lru_cache(maxsize=1024)
+def strptime(s, fmt):
+    return datetime.strptime(s, fmt)
+
+@lru_cache(maxsize=1024)
+def struct_time(s, fmt):
+    return time.strptime(s, fmt)
+
+@lru_cache(maxsize=1024)
+def reformat(s, fmt, to):
+    return time.strftime(to, struct_time(s, fmt))
+
+@lru_cache(maxsize=1024)
+def utc_span(start, end):
+    '''
+    Naive UTC start and end of a timeslot given as site timestamps,
+    e.g. 2022-10-18T06:00:00+11:00, using the offset of the start.
+    '''
+    start, end = start.split('+'), end.split('+')
+    offset     = timedelta(hours=int(start[1][:2]))
+    return strptime(start[0], ISO_FORMAT) - offset, strptime(end[0], ISO_FORMAT) - offset
+
+
+def now():
+    '''
+    Naive UTC time, fixed for everything that runs inside snapshot().
+    '''
+    return _now or datetime.utcnow()
+
+def local_now():
+    return now().replace(tzinfo=timezone.utc).astimezone(melbourne)
+
+@contextmanager
+def snapshot():
+    global _now
+    with _now_lock:
+        owner = _now is None
+        if owner:
+            _now = datetime.utcnow()
+    try:
+        yield _now
+    finally:
+        if owner:
+            with _now_lock:
+                _now = None
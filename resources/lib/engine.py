@@ -0,0 +1,435 @@
+import asyncio, http.client, io, random, ssl, threading, time, zlib
+
+from urllib.parse import urljoin, urlsplit
+from urllib.error import URLError, HTTPError
+from urllib.request import getproxies
+
+from resources.lib.client import ENCODINGS, HTTPClient, Response, content_decoder
+
+
+class AsyncHTTPClient:
+    '''
+    Minimal HTTP/1.1 client on asyncio streams, keeping idle connections
+    open per host so that lookups against the same provider reuse them.
+    Proxies from the environment are honoured as HTTPClient does.
+    '''
+
+    MAX_IDLE      = 8
+    MAX_REDIRECTS = 10
+    REDIRECTS     = (301, 302, 303, 307, 308)
+    CHUNK_SIZE    = 64 * 1024
+
+    def __init__(self):
+        self._idle = {}
+        self._context = ssl.create_default_context()
+        self._proxies = getproxies()
+
+    _proxy = HTTPClient._proxy
+
+    async def _connect(self, key):
+        scheme, host, port, proxy = key
+        if proxy:
+            proxy_host, proxy_port, authorization = proxy
+            reader, writer = await asyncio.open_connection(proxy_host, proxy_port)
+            if scheme == 'https':
+                return await self._tunnel(reader, writer, host, port or 443, authorization)
+            return reader, writer
+        if scheme == 'https':
+            return await asyncio.open_connection(host, port or 443, ssl=self._context, server_hostname=host)
+        else:
+            return await asyncio.open_connection(host, port or 80)
+
+    async def _tunnel(self, reader, writer, host, port, authorization):
+        head = [f'CONNECT {host}:{port} HTTP/1.1', f'Host: {host}:{port}']
+        if authorization:
+            head.append(f'Proxy-Authorization: {authorization}')
+        try:
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('iso-8859-1'))
+            await writer.drain()
+            status, reason, headers, keep_alive = await self._head(reader, None)
+            if status != 200:
+                raise OSError(f'Tunnel connection failed: {status} {reason}')
+            # the streams carry on over TLS to the host, through the proxy
+            if hasattr(writer, 'start_tls'):
+                await writer.start_tls(self._context, server_hostname=host)
+                return reader, writer
+            loop = asyncio.get_running_loop()
+            protocol = writer.transport.get_protocol()
+            transport = await loop.start_tls(writer.transport, protocol, self._context, server_hostname=host)
+        except BaseException:
+            writer.close()
+            raise
+        # before Python 3.11 streams can't be upgraded in place
+        return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
+
+    def _release(self, key, conn):
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.MAX_IDLE:
+            idle.append(conn)
+        else:
+            conn[1].close()
+
+    async def close(self):
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for reader, writer in conns:
+                writer.close()
+
+    async def _head(self, reader, timeout):
+        statusline = await asyncio.wait_for(reader.readline(), timeout)
+        if not statusline:
+            raise http.client.RemoteDisconnected('Remote end closed connection without response')
+        version, status, reason = (statusline.decode('iso-8859-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+        if not version.startswith('HTTP/'):
+            raise http.client.BadStatusLine(statusline)
+
+        lines = []
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            lines.append(line)
+            if line in (b'\r\n', b'\n', b''):
+                break
+        headers = http.client.parse_headers(io.BytesIO(b''.join(lines)))
+
+        keep_alive = version == 'HTTP/1.1' and 'close' not in headers.get('Connection', '').lower()
+        return int(status), reason, headers, keep_alive
+
+    async def _chunks(self, reader, method, status, headers, timeout):
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            return
+        if 'chunked' in headers.get('Transfer-Encoding', '').lower():
+            while True:
+                sizeline = await asyncio.wait_for(reader.readline(), timeout)
+                size = int(sizeline.split(b';')[0].strip(), 16)
+                if size == 0:
+                    while await asyncio.wait_for(reader.readline(), timeout) not in (b'\r\n', b'\n', b''):
+                        pass
+                    return
+                yield await asyncio.wait_for(reader.readexactly(size), timeout)
+                await asyncio.wait_for(reader.readline(), timeout)
+        elif headers.get('Content-Length') is not None:
+            remaining = int(headers['Content-Length'])
+            while remaining > 0:
+                chunk = await asyncio.wait_for(reader.read(min(remaining, self.CHUNK_SIZE)), timeout)
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b'', remaining)
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            while True:
+                chunk = await asyncio.wait_for(reader.read(self.CHUNK_SIZE), timeout)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def _exchange(self, key, conn, method, target, headers, timeout):
+        reader, writer = conn
+        head = [f'{method} {target} HTTP/1.1', f'Host: {key[1]}' + (f':{key[2]}' if key[2] else '')]
+        head += [f'{name}: {value}' for name, value in headers.items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('iso-8859-1'))
+        await asyncio.wait_for(writer.drain(), timeout)
+        return await self._head(reader, timeout)
+
+    async def _send(self, method, url, headers, timeout, until=None):
+        parts = urlsplit(url)
+        proxy = self._proxy(parts.scheme, parts.hostname)
+        key = (parts.scheme, parts.hostname, parts.port, proxy)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        if proxy and parts.scheme == 'http':
+            target = f'{parts.scheme}://{parts.netloc}{target}'
+            if proxy[2]:
+                headers = {**headers, 'Proxy-Authorization': proxy[2]}
+
+        idle = self._idle.get(key)
+        conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = await asyncio.wait_for(self._connect(key), timeout)
+
+        try:
+            head = await self._exchange(key, conn, method, target, headers, timeout)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn[1].close()
+            if not reused:
+                raise
+            # the server dropped an idle connection, so retry on a fresh one
+            conn, head = await asyncio.wait_for(self._connect(key), timeout), None
+        except BaseException:
+            conn[1].close()
+            raise
+
+        if head is None:
+            try:
+                head = await self._exchange(key, conn, method, target, headers, timeout)
+            except BaseException:
+                conn[1].close()
+                raise
+        status, reason, msg, keep_alive = head
+
+        decoder = content_decoder(msg.get('Content-Encoding'))
+        body = self._chunks(conn[0], method, status, msg, timeout)
+        chunks = []
+        stopped = False
+        until = until if 200 <= status < 300 else None
+        try:
+            async for chunk in body:
+                chunk = decoder.decompress(chunk) if decoder else chunk
+                if until is None:
+                    chunks.append(chunk)
+                # the caller has everything it needs, so drop the rest of the body
+                elif until(chunk):
+                    stopped = True
+                    break
+            if decoder and not stopped:
+                chunk = decoder.flush()
+                if until is None:
+                    chunks.append(chunk)
+                else:
+                    until(chunk)
+        except BaseException:
+            conn[1].close()
+            raise
+        finally:
+            await body.aclose()
+
+        framed = 'chunked' in msg.get('Transfer-Encoding', '').lower() or msg.get('Content-Length') is not None
+        if keep_alive and framed and not stopped:
+            self._release(key, conn)
+        else:
+            conn[1].close()
+
+        return Response(url, status, reason, msg, b''.join(chunks))
+
+    async def request(self, url, headers={}, timeout=None, until=None):
+        headers = {'Accept-Encoding': ENCODINGS, 'Connection': 'keep-alive', **headers}
+
+        for _ in range(self.MAX_REDIRECTS + 1):
+            try:
+                response = await self._send('GET', url, headers, timeout, until)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    http.client.HTTPException, ValueError, zlib.error) as e:
+                raise URLError(e)
+
+            location = response.headers.get('Location')
+            if response.status not in self.REDIRECTS or not location:
+                break
+            url = urljoin(url, location)
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(response.body))
+
+        return response
+
+
+class HostUnavailable(URLError):
+    '''
+    Raised without trying a host whose circuit breaker is open.
+    '''
+
+    def __init__(self, host):
+        super().__init__(f'{host} is unavailable, skipping')
+
+
+class HostLimit:
+    '''
+    Concurrency window for one provider host. The window grows by about one
+    request per round of successes and halves on timeouts, 429 and 5xx.
+    '''
+
+    def __init__(self, limit, maximum):
+        self.limit = float(limit)
+        self.maximum = maximum
+        self.active = 0
+        self._condition = None
+
+    async def acquire(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < max(1, int(self.limit)))
+            self.active += 1
+
+    async def release(self, success=None):
+        async with self._condition:
+            self.active -= 1
+            if success is True:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            elif success is False:
+                self.limit = max(1.0, self.limit / 2)
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    '''
+    Stops requests to a host after repeated failures, then lets a trial
+    request through once the cool-down has passed.
+    '''
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened = None
+        self.half_open = False
+
+    def allow(self):
+        if self.opened is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened >= self.cooldown:
+            # the cool-down restarts for everyone else, and again for the
+            # next trial should this one never report back
+            self.opened = now
+            self.half_open = True
+            return True
+        return False
+
+    def success(self):
+        self.failures = 0
+        self.opened = None
+        self.half_open = False
+
+    def failure(self):
+        self.failures += 1
+        if self.half_open or self.failures >= self.threshold:
+            self.opened = time.monotonic()
+            self.half_open = False
+
+
+class Engine:
+    '''
+    Runs provider lookups as coroutines on one event loop in a background
+    thread. run() is the synchronous entry point used by the scrapers.
+    '''
+
+    # initial and maximum concurrent requests, by host suffix
+    HOST_LIMITS = {
+        'bandcamp.com':     (6, 16),
+        'bcbits.com':       (6, 16),
+        'youtube.com':      (2, 6),
+        'music.apple.com':  (2, 4),
+        'itunes.apple.com': (2, 6),
+        'spotify.com':      (2, 6),
+        'appbooks.com':     (2, 6),
+    }
+    DEFAULT_HOST_LIMIT = (2, 8)
+
+    RETRIES           = 2
+    BACKOFF           = 0.5
+    BACKOFF_MAX       = 4
+    BREAKER_THRESHOLD = 3
+    BREAKER_COOLDOWN  = 60
+
+    def __init__(self, concurrency=8):
+        self.concurrency = concurrency
+        self._hosts = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._semaphore = None
+
+    def _start(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._client = AsyncHTTPClient()
+                self._semaphore = None
+                self._thread = threading.Thread(target=self._loop.run_forever, name='ExternalMedia', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._start()).result()
+
+    def _host_key(self, url):
+        host = urlsplit(url).hostname or ''
+        return next((suffix for suffix in self.HOST_LIMITS if host == suffix or host.endswith('.' + suffix)), host)
+
+    def host_limit(self, url):
+        key = self._host_key(url)
+        if key not in self._hosts:
+            self._hosts[key] = HostLimit(*self.HOST_LIMITS.get(key, self.DEFAULT_HOST_LIMIT))
+        return self._hosts[key]
+
+    def breaker(self, url):
+        key = self._host_key(url)
+        if key not in self._breakers:
+            self._breakers[key] = CircuitBreaker(self.BREAKER_THRESHOLD, self.BREAKER_COOLDOWN)
+        return self._breakers[key]
+
+    def backoff(self, attempt):
+        return min(self.BACKOFF_MAX, self.BACKOFF * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+    async def fetch(self, url, headers={}, timeout=5, until=None):
+        breaker = self.breaker(url)
+        if not breaker.allow():
+            raise HostUnavailable(self._host_key(url))
+        # the trial after a cool-down gets a single attempt, and may go
+        # ahead while the breaker is open
+        trial = breaker.half_open
+        admitted = lambda: trial or breaker.opened is None
+        attempts = 1 if trial else self.RETRIES + 1
+        for attempt in range(attempts):
+            try:
+                response = await self._fetch(url, headers, timeout, until, admitted)
+            except URLError as e:
+                if isinstance(e, HostUnavailable):
+                    raise
+                if isinstance(e, HTTPError) and e.code != 429 and e.code < 500:
+                    breaker.success()
+                    raise
+                # one failure per request, counted as soon as it fails so
+                # that lookups queued behind it stop once the breaker opens
+                if attempt == 0:
+                    breaker.failure()
+                if attempt == attempts - 1 or not admitted():
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+            else:
+                breaker.success()
+                return response
+
+    async def _fetch(self, url, headers, timeout, until, admitted=lambda: True):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        limit = self.host_limit(url)
+        await limit.acquire()
+        success = None
+        try:
+            # the breaker may have opened while this request waited for the host
+            if not admitted():
+                raise HostUnavailable(self._host_key(url))
+            async with self._semaphore:
+                response = await self._client.request(url, headers=headers, timeout=timeout, until=until)
+            success = True
+            return response
+        except HTTPError as e:
+            if e.code == 429 or e.code >= 500:
+                success = False
+            raise
+        except URLError as e:
+            if isinstance(e.reason, (asyncio.TimeoutError, TimeoutError)):
+                success = False
+            raise
+        finally:
+            await limit.release(success)
+
+    def shutdown(self):
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = self._semaphore = None
+            self._hosts = {}
+            self._breakers = {}
+        if loop:
+            asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+instance = Engine()
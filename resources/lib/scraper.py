@@ -1,11 +1,13 @@
 #!/usr/bin/env python
-import bs4, html, time, json, re, sys
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
+import asyncio, bs4, codecs, contextvars, html, time, json, re, sys, threading
+from concurrent.futures import Future
+from datetime import timedelta
 
-from urllib.request import Request, urlopen
 from urllib.parse import parse_qs, urlencode
-from urllib.error import URLError
+from urllib.error import URLError, HTTPError
+
+from resources.lib import client, clock, engine
+from resources.lib.cache import NO_EXPIRY
 
 DATE_FORMAT = '%Y-%m-%d'
 
@@ -15,12 +17,61 @@ USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 
 ignore_on_air = False
 
+http_cache = None
+
+result_cache = None
+
+media_cache = None
+
+# fastest tree builder available to bs4, html.parser is always present
+html_parser = 'lxml' if bs4.builder.builder_registry.lookup('lxml') else 'html.parser'
 
-def get(resource_path):
-    return urlopen_ua(Scraper.url_for(resource_path))
 
-def urlopen_ua(url):
-    return urlopen(Request(url, headers={'User-Agent': USER_AGENT}), timeout=5)
+def get(resource_path):
+    return get_cached(Scraper.url_for(resource_path))
+
+def get_cached(url):
+    if not http_cache:
+        return urlopen_ua(url).read()
+
+    meta, body = http_cache.get(url)
+    try:
+        response = urlopen_ua(url, headers=http_cache.validators(meta))
+    except HTTPError as e:
+        if e.code == 304 and body is not None:
+            http_cache.touch(url)
+            return body
+        raise
+
+    body = response.read()
+    http_cache.set(url, response.headers, body)
+    return body
+
+# inline scripts, styles and svg sprites, which no scraper reads
+RE_UNREAD_BLOCK = re.compile(rb'<(script|style|svg)(?=[\s/>])')
+
+def prune(markup):
+    lowered = markup.lower()
+    kept, pos = [], 0
+    while True:
+        block = RE_UNREAD_BLOCK.search(lowered, pos)
+        if not block:
+            break
+        end = lowered.find(b'>', block.end())
+        if end < 0:
+            break
+        if lowered[end - 1] != ord('/'):
+            end = lowered.find(b'</' + block[1], end)
+            end = lowered.find(b'>', end) if end >= 0 else -1
+            if end < 0:
+                break
+        kept.append(markup[pos:block.start()])
+        pos = end + 1
+    kept.append(markup[pos:])
+    return b''.join(kept)
+
+def urlopen_ua(url, headers={}):
+    return client.instance.request(url, headers={'User-Agent': USER_AGENT, **headers}, timeout=5)
 
 def get_json(url):
     return urlopen_ua(url).read().decode()
@@ -28,18 +79,135 @@ def get_json(url):
 def get_json_obj(url):
     return json.loads(get_json(url))
 
-def strptime(s, fmt):
-    return datetime.fromtimestamp(time.mktime(time.strptime(s, fmt)))
+
+class memoised:
+    '''
+    Property computed at most once per instance. The value is kept in a
+    slot the owning class declares as '__<name>', which Python mangles to
+    '_<Class>__<name>', so an override and the super() property it calls
+    keep separate values.
+    '''
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.slot = f'_{owner.__name__}__{name}'
+        if not hasattr(owner, self.slot):
+            raise TypeError(f"{owner.__name__}.__slots__ needs '__{name}' for the memoised {name}")
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            value = self.func(obj)
+            setattr(obj, self.slot, value)
+            return value
+
+
+class Item:
+    '''
+    Compact record for one entry of a listing. Scrapers build these, the
+    renderer reads the fields directly, and to_dict() gives the JSON:API
+    style dict that call() returns.
+    '''
+
+    ATTRIBUTES = (
+        'title', 'artist', 'subtitle', 'textbody', 'venue', 'start', 'end', 'date', 'year',
+        'aired', 'duration', 'url', 'on_air', 'thumbnail', 'background',
+    )
+    FIELDS     = frozenset(ATTRIBUTES)
+    __slots__  = ('type', 'id', 'links', 'relationships', 'included', 'extra', 'order') + ATTRIBUTES
+
+    def __init__(self, type=None, id=None, links=None, relationships=None, included=None, **attributes):
+        self.type          = type
+        self.id            = id
+        self.links         = links
+        self.relationships = relationships
+        self.included      = included
+        # attribute names as they were given, the key order of to_dict()
+        self.order         = tuple(attributes)
+        self.title         = attributes.pop('title', None)
+        self.artist        = attributes.pop('artist', None)
+        self.subtitle      = attributes.pop('subtitle', None)
+        self.textbody      = attributes.pop('textbody', None)
+        self.venue         = attributes.pop('venue', None)
+        self.start         = attributes.pop('start', None)
+        self.end           = attributes.pop('end', None)
+        self.date          = attributes.pop('date', None)
+        self.year          = attributes.pop('year', None)
+        self.aired         = attributes.pop('aired', None)
+        self.duration      = attributes.pop('duration', None)
+        self.url           = attributes.pop('url', None)
+        self.on_air        = attributes.pop('on_air', None)
+        self.thumbnail     = attributes.pop('thumbnail', None)
+        self.background    = attributes.pop('background', None)
+        # attributes the renderer doesn't read
+        self.extra         = attributes or None
+
+    @classmethod
+    def from_attributes(cls, type, id, attributes, links=None, relationships=None, included=None):
+        return cls(type, id, links, relationships, included, **attributes)
+
+    def clean(self):
+        # what normalise() does to the dict form, for the fields the renderer reads
+        for name in self.ATTRIBUTES:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                value = value.strip()
+            setattr(self, name, value or None)
+        if isinstance(self.type, str):
+            self.type = self.type.strip()
+        if isinstance(self.id, str):
+            self.id = self.id.strip()
+        if self.links:
+            self.links = {k: v for k, v in normalise(self.links).items() if v}
+        self.links = self.links or None
+        return self
+
+    def to_dict(self):
+        attributes = {}
+        for name in self.order:
+            if name in self.FIELDS:
+                value = getattr(self, name)
+                if value is not None:
+                    attributes[name] = value
+            else:
+                attributes[name] = self.extra[name]
+        # fields set after the item was built
+        for name in self.ATTRIBUTES:
+            if name not in attributes:
+                value = getattr(self, name)
+                if value is not None:
+                    attributes[name] = value
+
+        d = {
+            'type':       self.type,
+            'id':         self.id,
+            'attributes': attributes,
+        }
+        if self.links is not None:
+            d['links'] = self.links
+        if self.relationships:
+            d['relationships'] = self.relationships
+        if self.included:
+            d['included'] = self.included
+        return d
 
 
 class Resource:
+    __slots__ = ('_itemobj', '__path', '__img')
+
     def __init__(self, itemobj):
         self._itemobj = itemobj
 
     def id(self):
         return self.path.split('/')[-1]
 
-    @property
+    @memoised
     def path(self):
         return Scraper.resource_path_for(self._itemobj.find('a').attrs['href'])
 
@@ -48,7 +216,7 @@ class Resource:
     def type(self):
         return self.RE_CAMEL.sub('_', self.__class__.__name__).lower()
 
-    @property
+    @memoised
     def img(self):
         return self._itemobj.find('img')
 
@@ -77,31 +245,21 @@ class Resource:
     def included(self):
         return None
 
-    def to_dict(self):
-        d = {
-            'type':       self.type,
-            'id':         self.id(),
-            'attributes': {
+    def to_item(self):
+        return Item.from_attributes(
+            self.type,
+            self.id(),
+            {
                 'title': self.title,
                 **self.attributes(),
             },
-            'links'     : self.links(),
-        }
-
-        r = self.relationships()
-        if r:
-            d = {
-                **d,
-                'relationships': r,
-            }
+            self.links(),
+            self.relationships(),
+            self.included(),
+        )
 
-        i = self.included()
-        if i:
-            d = {
-                **d,
-                'included': i,
-            }
-        return d
+    def to_dict(self):
+        return self.to_item().to_dict()
 
 
 
@@ -111,36 +269,200 @@ class UnmatchedResourcePath(BaseException):
     '''
     '''
 
-def strip_value(v):
-    if  isinstance(v, dict):
-        return strip_values(v)
-    elif isinstance(v, list):
-        return [strip_values(x) for x in v]
-    elif isinstance(v, str):
-        return v.strip()
+class UnmatchedWebsitePath(BaseException):
+    '''
+    '''
+
+# rounds of dropping empty values that a non-empty plain value outlasts
+FOREVER = float('inf')
+
+def as_dicts(data):
+    if isinstance(data, Item):
+        return data.to_dict()
+    elif isinstance(data, list):
+        return [item.to_dict() if isinstance(item, Item) else item for item in data]
     else:
-        return v
+        return data
 
-def strip_values(d):
+def normalise(d):
+    '''
+    Strips strings and drops empty values of a generate() result in one pass.
+    '''
     if isinstance(d, dict):
-        return { k: remove_nulls(strip_value(v)) for k, v in d.items() }
+        return _normalise(d, 0, True)[0]
     else:
         return d
 
-def remove_nulls(obj):
-    if  isinstance(obj, dict):
-        return { k: remove_nulls(v) for k, v in obj.items() if v }
-    elif isinstance(obj, list):
-        return [remove_nulls(x) for x in obj if x]
+def _normalise(obj, passes, strip):
+    # Returns the dict or list obj after `passes` rounds of dropping empty
+    # values, and how many such rounds obj would stay non-empty for, which
+    # decides whether its parent keeps it. Values under a stripped dict take
+    # one more round than the dict itself, and lists only clean the dicts
+    # directly inside them. Plain values are handled inline, as they make up
+    # most of a result.
+    if isinstance(obj, dict):
+        result, lasts = {}, -1
+        for k, v in obj.items():
+            if isinstance(v, (dict, list)):
+                if strip:
+                    v, n = _normalise(v, passes + 1, True)
+                    n = max(n - 1, -1)
+                else:
+                    v, n = _normalise(v, passes, False)
+                if n >= passes - 1:
+                    result[k] = v
+                if n > lasts:
+                    lasts = n
+            else:
+                if strip and isinstance(v, str):
+                    v = v.strip()
+                if v:
+                    result[k] = v
+                    lasts = FOREVER
+                elif not passes:
+                    result[k] = v
+        return result, (lasts + 1 if obj else -1)
     else:
-        return obj
+        result, lasts = [], -1
+        for v in obj:
+            if isinstance(v, (dict, list)):
+                v, n = _normalise(v, passes, strip and isinstance(v, dict))
+                if n >= passes - 1:
+                    result.append(v)
+                if n > lasts:
+                    lasts = n
+            elif v:
+                result.append(v)
+                lasts = FOREVER
+            elif not passes:
+                result.append(v)
+        return result, (lasts + 1 if obj else -1)
+
+
+class RouteIndex:
+    '''
+    Path patterns of a set of scrapers compiled into one alternation, so that
+    a path is routed with a single match. Earlier scrapers win, as they did
+    when the scrapers were tried one at a time.
+    '''
+
+    def __init__(self, scrapers, attribute):
+        scrapers = list(scrapers)
+        patterns = [getattr(scraper, attribute) for scraper in scrapers]
+        self.regex = re.compile('^(?:' + '|'.join(
+            f'(?P<r{i}>' +
+            re.sub('{([A-z]+)}', f'(?P<r{i}_\\1>[^/]+?)', pattern) +
+            f'(?:[?](?P<r{i}_query_params>.+))?' +
+            '$)'
+            for i, pattern in enumerate(patterns)
+        ) + ')')
+        self.routes = [
+            (scraper, [
+                (name, self.regex.groupindex[f'r{i}_{name}'])
+                for name in re.findall('{([A-z]+)}', pattern) + ['query_params']
+            ])
+            for i, (scraper, pattern) in enumerate(zip(scrapers, patterns))
+        ]
+
+    def match(self, path):
+        m = self.regex.match(path)
+        if m:
+            # the route's own group closes last, so it names the winning scraper
+            scraper, groups = self.routes[int(m.lastgroup[1:])]
+            return scraper, {name: m.group(index) for name, index in groups}
+
+
+class Listing:
+    '''
+    Cleaned Items of a scraper, produced while the renderer iterates.
+    links is set once the last item has been read.
+    '''
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.links   = None
+
+    def __iter__(self):
+        max_age = self.scraper.max_age() if result_cache else 0
+        cached = result_cache.get(self.scraper.resource_path) if max_age else None
+        if cached is not None:
+            data = cached.get('data', [])
+            for d in ([data] if isinstance(data, dict) else data):
+                yield Item.from_attributes(
+                    d.get('type'), d.get('id'), d.get('attributes', {}),
+                    d.get('links'), d.get('relationships'), d.get('included'),
+                ).clean()
+            self.links = cached.get('links')
+            return
+
+        # with caching on, the dict form of each item is kept as it goes past
+        kept = [] if max_age else None
+        try:
+            with clock.snapshot():
+                stream = self.scraper.stream()
+                while True:
+                    try:
+                        item = next(stream)
+                    except StopIteration as done:
+                        links = done.value
+                        break
+                    if item:
+                        if kept is not None:
+                            kept.append(item.to_dict())
+                        yield item.clean()
+        finally:
+            with Scraper._documents_lock:
+                Scraper._documents.clear()
+
+        result = normalise({'data': kept or [], 'links': links})
+        self.links = result.get('links')
+        if kept is not None:
+            if links is None:
+                del result['links']
+            result_cache.set(self.scraper.resource_path, result, max_age)
 
 
 class Scraper:
+    # seconds a result stays fresh in result_cache, 0 for results that are not kept
+    MAX_AGE         = 0
+
+    # fetched and parsed pages for the current call(), keyed by url and parsed subtrees
+    _documents      = {}
+    _documents_lock = threading.Lock()
+
+    # compiled path patterns, and route indexes over the scrapers keyed by pattern attribute
+    _regexes        = {}
+    _routes         = {}
+
     @classmethod
     def call(cls, resource_path):
         scraper = cls.find_by_resource_path(resource_path)
-        return strip_values(scraper.generate())
+        max_age = scraper.max_age() if result_cache else 0
+        if max_age:
+            result = result_cache.get(resource_path)
+            if result is not None:
+                return result
+
+        try:
+            with clock.snapshot():
+                result = scraper.generate()
+        finally:
+            with Scraper._documents_lock:
+                Scraper._documents.clear()
+        if 'data' in result:
+            result['data'] = as_dicts(result['data'])
+        result = normalise(result)
+
+        if max_age:
+            result_cache.set(resource_path, result, max_age)
+        return result
+
+    @classmethod
+    def items(cls, resource_path):
+        '''
+        Like call(), but the listing is streamed as cleaned Item records.
+        '''
+        return Listing(cls.find_by_resource_path(resource_path))
 
     @classmethod
     def url_for(cls, resource_path):
@@ -148,31 +470,47 @@ class Scraper:
 
     @classmethod
     def resource_path_for(cls, website_path):
-        scraper = cls.find_by_website_path(website_path)
-        m = scraper.match_website_path(website_path)
-        if m:
-            return scraper.RESOURCE_PATH_PATTERN.format_map(m.groupdict())
+        scraper, groupdict = cls.match_website_route(website_path)
+        return scraper.RESOURCE_PATH_PATTERN.format_map(groupdict)
 
 
     @classmethod
     def find_by_resource_path(cls, resource_path):
-        try:
-            return next(scraper for scraper in cls.__subclasses__() if scraper.matching_resource_path(resource_path))(resource_path)
-        except StopIteration:
+        route = cls.routes('RESOURCE_PATH_PATTERN').match(resource_path)
+        if not route:
             raise UnmatchedResourcePath(f"No match for '{resource_path}'")
+        scraper, groupdict = route
+        return scraper(resource_path, groupdict)
 
     @classmethod
     def find_by_website_path(cls, website_path):
-        return next(scraper for scraper in cls.__subclasses__() if scraper.match_website_path(website_path))
+        return cls.match_website_route(website_path)[0]
+
+    @classmethod
+    def match_website_route(cls, website_path):
+        route = cls.routes('WEBSITE_PATH_PATTERN').match(website_path)
+        if not route:
+            raise UnmatchedWebsitePath(f"No match for '{website_path}'")
+        return route
+
+    @classmethod
+    def routes(cls, attribute):
+        index = Scraper._routes.get((cls, attribute))
+        if index is None:
+            index = Scraper._routes[(cls, attribute)] = RouteIndex(cls.__subclasses__(), attribute)
+        return index
 
     @classmethod
     def regex_from(cls, pattern):
-        return re.compile(
-          '^' +
-          re.sub('{([A-z]+)}', '(?P<\\1>[^/]+?)', pattern) +
-          '(?:[?](?P<query_params>.+))?' +
-          '$'
-        )
+        regex = Scraper._regexes.get(pattern)
+        if regex is None:
+            regex = Scraper._regexes[pattern] = re.compile(
+              '^' +
+              re.sub('{([A-z]+)}', '(?P<\\1>[^/]+?)', pattern) +
+              '(?:[?](?P<query_params>.+))?' +
+              '$'
+            )
+        return regex
 
     @classmethod
     def resource_path_regex(cls):
@@ -188,18 +526,84 @@ class Scraper:
 
     @classmethod
     def matching_resource_path(cls, resource_path):
-        if cls.match_resource_path(resource_path):
-            return cls(resource_path)
+        m = cls.match_resource_path(resource_path)
+        if m:
+            return cls(resource_path, m.groupdict())
 
 
-    def __init__(self, resource_path):
+    def __init__(self, resource_path, groupdict=None):
         self.resource_path = resource_path
-        m = self.__class__.resource_path_regex().match(self.resource_path)
-        if m:
-            self.groupdict = m.groupdict()
+        if groupdict is None:
+            m = self.__class__.resource_path_regex().match(self.resource_path)
+            groupdict = m.groupdict() if m else None
+        if groupdict is not None:
+            self.groupdict = groupdict
+
+    def _document(self, key, build):
+        with Scraper._documents_lock:
+            document = Scraper._documents.get(key)
+            owner = document is None
+            if owner:
+                document = Scraper._documents[key] = Future()
+
+        if owner:
+            try:
+                document.set_result(build())
+            except BaseException as e:
+                document.set_exception(e)
+                with Scraper._documents_lock:
+                    Scraper._documents.pop(key, None)
+
+        return document.result()
+
+    def max_age(self):
+        return self.__class__.MAX_AGE
+
+    def stream(self):
+        '''
+        Yields the listing one Item at a time, and returns its links.
+        List scrapers override this, detail scrapers override generate().
+        '''
+        if type(self).generate is Scraper.generate:
+            raise NotImplementedError(f'{type(self).__name__} has no listing')
+        result = self.generate()
+        data = result.get('data')
+        yield from ([data] if isinstance(data, Item) else data or [])
+        return result.get('links')
+
+    def generate(self):
+        data, stream = [], self.stream()
+        while True:
+            try:
+                data.append(next(stream))
+            except StopIteration as done:
+                links = done.value
+                break
+        result = {'data': data}
+        if links is not None:
+            result['links'] = links
+        return result
+
+    def page(self, pruned=True):
+        url = self.url()
+        if not pruned:
+            return self._document((url,), lambda: get_cached(url))
+        return self._document((url, 'pruned'), lambda: prune(self.page(pruned=False)))
 
     def soup(self):
-        return bs4.BeautifulSoup(get(self.resource_path), 'html.parser')
+        # subtrees generate() reads, declared by list scrapers as PARSE_ONLY
+        parse_only = getattr(self, 'PARSE_ONLY', None)
+        # a strainer passes over scripts and styles about as fast as prune() drops them
+        pruned = parse_only is None
+        return self._document((self.url(), parse_only), lambda: self.parse(self.page(pruned), parse_only))
+
+    def parse(self, markup, parse_only=None):
+        if html_parser != 'html.parser':
+            try:
+                return bs4.BeautifulSoup(markup, html_parser, parse_only=parse_only)
+            except (bs4.FeatureNotFound, bs4.ParserRejectedMarkup):
+                pass
+        return bs4.BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
 
     def url(self):
         return f'{URL_BASE}{self.website_path()}'
@@ -246,16 +650,14 @@ class Scraper:
 class ProgramsScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/programs'
     WEBSITE_PATH_PATTERN = '/explore/programs'
+    MAX_AGE = 6 * 60 * 60
+    PARSE_ONLY = bs4.SoupStrainer('div', class_='card clearfix')
 
-    def generate(self):
+    def stream(self):
+        for item in self.soup().findAll('div', class_='card clearfix'):
+            yield Program(item).to_item()
         return {
-            'data': [
-                Program(item).to_dict()
-                for item in self.soup().findAll('div', class_='card clearfix')
-            ],
-            'links': {
-                'self': self.__class__.RESOURCE_PATH_PATTERN
-            },
+            'self': self.__class__.RESOURCE_PATH_PATTERN
         }
 
 
@@ -296,37 +698,33 @@ class ProgramScraper(Scraper):
                     return f"/explore/{d['collection']}/{d['program']}/episodes"
 
         collections = [
-            {
-                'type': 'collection',
-                'id': Scraper.resource_path_for(map_path(anchor.attrs['href'])),
-                'attributes': {
-                    'title': ' - '.join((title, anchor.text)),
-                    'thumbnail':  thumbnail,
-                    'background': background,
-                    'textbody':   textbody,
-                },
-                'links': {
+            Item(
+                type       = 'collection',
+                id         = Scraper.resource_path_for(map_path(anchor.attrs['href'])),
+                title      = ' - '.join((title, anchor.text)),
+                thumbnail  = thumbnail,
+                background = background,
+                textbody   = textbody,
+                links      = {
                     'self': Scraper.resource_path_for(map_path(anchor.attrs['href'])),
                 }
-            }
+            )
             for anchor in soup.find_all('a', class_='program-nav__anchor')
         ]
         highlights = soup.find('a', string=re.compile('highlights'))
         if highlights:
             collections.append(
-                {
-                    'type': 'collection',
-                    'id': Scraper.resource_path_for(highlights.attrs['href']),
-                    'attributes': {
-                        'title': ' - '.join((title, 'Segments')),
-                        'thumbnail': thumbnail,
-                        'background': background,
-                        'textbody':  textbody,
-                    },
-                    'links': {
+                Item(
+                    type       = 'collection',
+                    id         = Scraper.resource_path_for(highlights.attrs['href']),
+                    title      = ' - '.join((title, 'Segments')),
+                    thumbnail  = thumbnail,
+                    background = background,
+                    textbody   = textbody,
+                    links      = {
                         'self': Scraper.resource_path_for(highlights.attrs['href']),
                     }
-                }
+                )
             )
         return {
             'data': collections,
@@ -334,16 +732,27 @@ class ProgramScraper(Scraper):
 
 
 class AudioItemGenerator:
-    def generate(self):
-        return {
-            'data': [
-                item for item in [
-                    AudioItem.factory(div)
-                    for div in self.soup().findAll(class_='card__text')
-                ]
-            ],
-            'links': self.pagination()
-        }
+    PARSE_ONLY = bs4.SoupStrainer(class_='card__text')
+
+    def stream(self):
+        cards = CardScanner().scan(self.page())
+        if cards is None:
+            items = (AudioItem.factory(div) for div in self.card_divs())
+        else:
+            items = (AudioItem.from_playable(**card) if card else None for card in cards)
+        for item in items:
+            yield item.to_item() if item else None
+        return self.pagination()
+
+    def card_divs(self):
+        divs = self.soup().findAll(class_='card__text')
+        for div in divs:
+            playable = div.find(lambda tag:tag.name == 'div' and 'data-view-playable' in tag.attrs)
+            if playable and isinstance(playable.parent.parent, bs4.BeautifulSoup):
+                # the account toggle is read above the strained card, so parse the whole page
+                soup = self._document((self.url(), None), lambda: self.parse(self.page()))
+                return soup.findAll(class_='card__text')
+        return divs
 
 class ProgramBroadcastsScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/programs/{program_id}/broadcasts'
@@ -382,38 +791,34 @@ class ProgramBroadcastsScraper(Scraper):
                     return f"/explore/{d['collection']}/{d['program']}/episodes"
 
         collections = [
-            {
-                'type': 'collection',
-                'id': Scraper.resource_path_for(map_path(anchor.attrs['href'])),
-                'attributes': {
-                    'title': ' - '.join((title, anchor.text)),
-                    'thumbnail':  thumbnail,
-                    'background': background,
-                    'textbody':   textbody,
-                },
-                'links': {
+            Item(
+                type       = 'collection',
+                id         = Scraper.resource_path_for(map_path(anchor.attrs['href'])),
+                title      = ' - '.join((title, anchor.text)),
+                thumbnail  = thumbnail,
+                background = background,
+                textbody   = textbody,
+                links      = {
                     'self': Scraper.resource_path_for(map_path(anchor.attrs['href'])),
                 }
-            }
+            )
             for anchor in soup.find_all('a', class_='program-nav__anchor')
         ]
 
         # hackety - hack - hack - hack ... just blindly turn "Broadcasts" into "Segments" while nobody is looking
-        collections[0]['id'] = collections[0]['id'].replace('broadcasts', 'segments')
-        collections[0]['links']['self'] = collections[0]['id']
-        collections[0]['attributes']['title'] = collections[0]['attributes']['title'].replace('Broadcasts', 'Segments')
+        collections[0].id = collections[0].id.replace('broadcasts', 'segments')
+        collections[0].links['self'] = collections[0].id
+        collections[0].title = collections[0].title.replace('Broadcasts', 'Segments')
 
         broadcasts = [
             item for item in [
-                BroadcastCollection(div).to_dict()
+                BroadcastCollection(div).to_item()
                 for div in self.soup().findAll(class_='card')
             ]
         ]
 
-        images = {
-            'background': background,
-        }
-        [b['attributes'].update(images) for b in broadcasts]
+        for b in broadcasts:
+            b.background = background
 
         collections = [item for item in (collections[::-1] + broadcasts) if item]
 
@@ -424,27 +829,28 @@ class ProgramBroadcastsScraper(Scraper):
 
 
 
-class ProgramPodcastsScraper(Scraper, AudioItemGenerator):
+class ProgramPodcastsScraper(AudioItemGenerator, Scraper):
     RESOURCE_PATH_PATTERN = '/programs/{program_id}/podcasts'
     WEBSITE_PATH_PATTERN = '/explore/podcasts/{program_id}/episodes'
 
 
-class ProgramSegmentsScraper(Scraper, AudioItemGenerator):
+class ProgramSegmentsScraper(AudioItemGenerator, Scraper):
     RESOURCE_PATH_PATTERN = '/programs/{program_id}/segments'
     WEBSITE_PATH_PATTERN = '/explore/programs/{program_id}/highlights'
 
 
-class OnDemandSegmentsScraper(Scraper, AudioItemGenerator):
+class OnDemandSegmentsScraper(AudioItemGenerator, Scraper):
     RESOURCE_PATH_PATTERN = '/segments'
     WEBSITE_PATH_PATTERN = '/on-demand/segments'
+    MAX_AGE = 5 * 60
 
 
-class OnDemandBroadcastsScraper(Scraper, AudioItemGenerator):
+class OnDemandBroadcastsScraper(AudioItemGenerator, Scraper):
     RESOURCE_PATH_PATTERN = '/broadcasts'
     WEBSITE_PATH_PATTERN = '/on-demand/episodes'
 
 
-class ArchivesScraper(Scraper, AudioItemGenerator):
+class ArchivesScraper(AudioItemGenerator, Scraper):
     RESOURCE_PATH_PATTERN = '/archives'
     WEBSITE_PATH_PATTERN = '/on-demand/archives'
 
@@ -452,14 +858,230 @@ class ArchivesScraper(Scraper, AudioItemGenerator):
 class ArchiveScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/archives/{item}'
     WEBSITE_PATH_PATTERN = '/on-demand/archives/{item}'
+    MAX_AGE = 24 * 60 * 60
 
     def generate(self):
-        item = self.soup().find(class_='adaptive-banner__audio-component')
+        item = AudioItem.factory(self.soup().find(class_='adaptive-banner__audio-component'))
         return {
-            'data': AudioItem.factory(item)
+            'data': item.to_item() if item else None
         }
 
 
+class PageScanner:
+    '''
+    Collects named fields from a page in one pass as it streams in. `first`
+    patterns keep their first match and `every` patterns keep all of them.
+    Once every field named in `until` is found the rest of the page is
+    skipped. Each pattern carries on from where it stopped, so only the
+    last MAX_MATCH characters are looked at again when more text arrives.
+    Patterns must end in a literal, so that a match can not be cut short at
+    a chunk boundary, and matches longer than MAX_MATCH may be missed.
+    '''
+
+    # longest field a provider pattern reads, an escaped youtube description
+    MAX_MATCH = 16 * 1024
+    SCAN_SIZE = 64 * 1024
+
+    def __init__(self, first={}, every={}, until=()):
+        self.first = dict.fromkeys(first)
+        self.every = {name: [] for name in every}
+        self._first = dict(first)
+        self._every = dict(every)
+        self._until = until
+        # where each pattern carries on searching in the kept text
+        self._next = dict.fromkeys([*first, *every], 0)
+        self._tail = ''
+        self._text = []
+        self._size = 0
+        self.bytes = 0
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    @property
+    def done(self):
+        return bool(self._until) and all(self.first[name] is not None for name in self._until)
+
+    def feed(self, chunk):
+        self.bytes += len(chunk)
+        text = self._decoder.decode(chunk)
+        self._text.append(text)
+        self._size += len(text)
+        if self._size >= self.SCAN_SIZE:
+            self._scan()
+        return self.done
+
+    def close(self):
+        self._text.append(self._decoder.decode(b'', True))
+        self._scan()
+
+    def _scan(self):
+        buffer = self._tail + ''.join(self._text)
+        self._text, self._size = [], 0
+        # a match starting before this point would have been complete already
+        cut = max(0, len(buffer) - self.MAX_MATCH)
+
+        for name, pattern in list(self._first.items()):
+            match = pattern.search(buffer, self._next[name])
+            if match:
+                self.first[name] = match.groupdict()
+                del self._first[name]
+            else:
+                self._next[name] = max(self._next[name], cut)
+        for name, pattern in self._every.items():
+            end = self._next[name]
+            for match in pattern.finditer(buffer, end):
+                self.every[name].append(match.groupdict())
+                end = match.end()
+            self._next[name] = max(end, cut)
+
+        self._tail = buffer[cut:]
+        for name in self._next:
+            self._next[name] = max(0, self._next[name] - cut)
+
+
+class CardScanner:
+    '''
+    Reads .card__text cards straight from page markup, without building a
+    tree: the data-view-playable JSON, the card__anchor href, whether the
+    player sits in an account toggle and the card body text. scan() gives
+    up with None when a card isn't plain enough to be sure every parser
+    would build the same tree from it, and the caller falls back to bs4.
+    '''
+
+    RE_TAG          = re.compile(r'<!--.*?-->|<(/?)([a-zA-Z][^\s/>]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.S)
+    RE_ATTR         = re.compile(r'([^\s=/>"\']+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+)))?')
+    WHITESPACE      = ' \n\t\f\r'
+    # bare ampersands and unterminated references are decoded differently by each parser
+    RE_LOOSE_ENTITY = re.compile(r'&(?!#\d+;|#[xX][0-9a-fA-F]+;|[a-zA-Z][a-zA-Z0-9]*;)[#a-zA-Z]')
+
+    # lxml nests what follows <source> inside it, so it is left to bs4
+    VOID     = {'br', 'hr', 'img', 'input', 'wbr'}
+    PHRASING = {'a', 'abbr', 'b', 'bdi', 'bdo', 'button', 'cite', 'code', 'data', 'dfn', 'em', 'i', 'kbd', 'label', 'mark', 'q',
+                's', 'samp', 'small', 'span', 'strong', 'sub', 'sup', 'time', 'u', 'var'}
+    BLOCK    = {'article', 'aside', 'blockquote', 'div', 'figcaption', 'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                'header', 'li', 'main', 'nav', 'ol', 'p', 'picture', 'section', 'ul'}
+    # elements that lxml closes when anything but phrasing content opens inside them
+    PHRASING_ONLY = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p'}
+
+    class Unsure(Exception):
+        pass
+
+    def scan(self, markup):
+        try:
+            return list(self.cards(markup.decode('utf-8')))
+        except (UnicodeDecodeError, self.Unsure):
+            return None
+
+    def cards(self, page):
+        stack = []
+        for tag in self.RE_TAG.finditer(page):
+            closing, name, attrs = tag.groups()
+            if not stack and (not attrs or 'card__text' not in attrs or closing):
+                continue
+            if name is None:
+                continue
+            name = name.lower()
+            if not stack:
+                attrs = self.attributes(attrs)
+                if 'card__text' not in attrs.get('class', '').split():
+                    continue
+                if name not in self.PHRASING | self.BLOCK or tag[3].endswith('/'):
+                    raise self.Unsure()
+                stack, found, playable = [(name, attrs, tag.end())], {}, None
+                continue
+
+            if closing:
+                if stack[-1][0] != name:
+                    raise self.Unsure()
+                name, attrs, start = stack.pop()
+                for element in found.values():
+                    if element[0] == start:
+                        element[2] = page[start:tag.start()]
+                if not stack:
+                    yield self.card(found, playable)
+                continue
+
+            attrs = self.attributes(attrs)
+            classes = attrs.get('class', '').split()
+            if 'card__text' in classes or self.restructured(name, [element[0] for element in stack]):
+                raise self.Unsure()
+            if tag[3].endswith('/') and name not in self.VOID:
+                raise self.Unsure()
+
+            start = tag.end()
+            for key in ('card__body', 'card__meta', 'card__anchor'):
+                if key in classes and key not in found:
+                    found[key] = [start, attrs, '' if name in self.VOID else None]
+            if name == 'div' and playable is None and 'data-view-playable' in attrs:
+                if len(stack) < 2:
+                    # the account toggle would be read from outside the card
+                    raise self.Unsure()
+                playable = (attrs['data-view-playable'], 'data-view-account-toggle' in stack[-2][1])
+
+            if name not in self.VOID:
+                stack.append((name, attrs, start))
+
+        if stack:
+            raise self.Unsure()
+
+    def restructured(self, name, names):
+        # unknown elements, or nesting that a parser would close or move
+        parent = names[-1]
+        if name not in self.VOID and name not in self.PHRASING and name not in self.BLOCK:
+            return True
+        if name == 'a' and 'a' in names:
+            return True
+        if name == 'li' and parent not in ('ul', 'ol'):
+            return True
+        if name == 'p' and parent in self.PHRASING:
+            return True
+        if name in self.BLOCK or name == 'hr':
+            return 'p' in names or parent in self.PHRASING_ONLY
+        return False
+
+    def card(self, found, playable):
+        if playable is None:
+            return None
+
+        body = found.get('card__body') or found.get('card__meta')
+        anchor = found.get('card__anchor')
+        if anchor and 'href' not in anchor[1]:
+            raise self.Unsure()
+
+        return {
+            'view_playable':         self.unescape(playable[0]),
+            'subscription_required': playable[1],
+            'textbody':              self.text(body[2]) if body else '',
+            'href':                  self.unescape(anchor[1]['href']) if anchor else None,
+        }
+
+    def attributes(self, source):
+        attrs = {}
+        for attr in self.RE_ATTR.finditer(source):
+            name = attr[1].lower()
+            if name in attrs:
+                raise self.Unsure()
+            value = attr[2] if attr[2] is not None else attr[3] if attr[3] is not None else attr[4]
+            attrs[name] = value if value is not None else ''
+        return attrs
+
+    def text(self, source):
+        if '<!' in source or '\r' in source or '\0' in source:
+            raise self.Unsure()
+        strings = []
+        for string in self.RE_TAG.split(source)[::4]:
+            string = self.unescape(string)
+            # as bs4 does, whitespace-only strings shrink to a newline or a space
+            if string and not string.strip(self.WHITESPACE):
+                string = '\n' if '\n' in string else ' '
+            strings.append(string)
+        return ''.join(strings)
+
+    def unescape(self, value):
+        if self.RE_LOOSE_ENTITY.search(value):
+            raise self.Unsure()
+        return html.unescape(value)
+
+
 class ExternalMedia:
     RE_BANDCAMP_ALBUM_ID             = re.compile(r'https://bandcamp.com/EmbeddedPlayer/.*album=(?P<media_id>[^/]+)')
     RE_BANDCAMP_ALBUM_ART            = re.compile(r'"art_id":(\w+)')
@@ -474,6 +1096,7 @@ class ExternalMedia:
     RE_BANDCAMP_TRACK_ARTIST         = re.compile(r'data-band="[^"]*;name&quot;:&quot;(?P<artist>[^&]+)&quot;')
     RE_BANDCAMP_TRACK_DURATION       = re.compile(r'duration&quot;:(?P<duration>[\d\.]+),')
     RE_BANDCAMP_TRACK_BAND_ART       = re.compile(r'data-band="[^"]*image_id&quot;:(?P<band_art_id>\d+)}"')
+    RE_BANDCAMP_TRACK_DATA           = re.compile(r'data-tralbum="[^"]*"')
 
     RE_SOUNDCLOUD_PLAYLIST_ID        = re.compile(r'.+soundcloud\.com/playlists/(?P<media_id>[^&]+)')
 
@@ -508,6 +1131,9 @@ class ExternalMedia:
     APPLE_ALBUM_URL                  = 'https://music.apple.com/au/album/{}'
     RE_APPLE_ALBUM_ART               = re.compile(r'meta name="twitter:image" content="(?P<art_url>[^"]+)">')
     RE_APPLE_DURATION                = re.compile(r'meta property="music:song:duration" content="PT(?P<hours>[\d]+H)?(?P<minutes>[\d]+M)?(?P<seconds>[\d]+S)?">')
+    RE_APPLE_ALBUM_NUMBER            = re.compile(r'(?:^|/)(?:id)?(?P<album_id>\d+)(?:[?#].*)?$')
+    RE_APPLE_ART_SIZE                = re.compile(r'/\d+x\d+bb\.jpg$')
+    APPLE_LOOKUP_URL                 = 'https://itunes.apple.com/lookup?id={}&entity=song&country=au'
 
     RE_MEDIA_URLS = {
         'bandcamp': {
@@ -548,8 +1174,81 @@ class ExternalMedia:
         },
     }
 
+    # lookups for each plugin, cheapest first, with the fields each one fills
+    STRATEGIES = {
+        'bandcamp': [
+            ('api',    ('art', 'band', 'duration'),                    'bandcamp_album_art'),
+        ],
+        'bandcamp_link': [
+            ('page',   ('art', 'band', 'title', 'artist', 'duration'), 'bandcamp_track_art'),
+        ],
+        'bandcamp_band_link': [
+            ('page',   ('art', 'band', 'title', 'artist'),             'bandcamp_band_art'),
+        ],
+        'bandcamp_track': [
+            ('page',   ('art', 'band', 'title', 'artist', 'duration'), 'bandcamp_track_art'),
+        ],
+        'indigitube': [
+            ('api',    ('art', 'title', 'artist', 'textbody'),         'indigitube_album_art'),
+        ],
+        'spotify': [
+            ('page',   ('art', 'duration'),                            'spotify_album_art'),
+        ],
+        'spotify_playlist': [
+            ('page',   ('art', 'duration'),                            'spotify_album_art'),
+        ],
+        'apple': [
+            ('lookup', ('art', 'duration'),                            'apple_album_lookup'),
+            ('page',   ('art', 'duration'),                            'apple_album_art'),
+        ],
+        'youtube_playlist': [
+            ('page',   ('art', 'title', 'artist', 'duration'),         'youtube_playlist_art'),
+        ],
+        'youtube': [
+            ('page',   ('title', 'artist', 'duration', 'textbody'),    'youtube_video_duration'),
+        ],
+    }
+
+    # requests, bytes read, seconds taken and fields filled, by plugin and strategy
+    costs = {}
+    _fetched = contextvars.ContextVar('fetched', default=None)
+
+    # seconds looked up metadata is kept in media_cache
+    MEDIA_MAX_AGE = 30 * 24 * 60 * 60
+
+    # lookups in flight on the engine loop, by media_cache key
+    _pending = {}
+
     fetch_yt_video = False
 
+    @classmethod
+    def shutdown(cls):
+        engine.instance.shutdown()
+
+    def _count(self, nbytes):
+        fetched = self._fetched.get()
+        if fetched is not None:
+            fetched[0] += nbytes
+
+    async def fetch_text(self, url):
+        response = await engine.instance.fetch(url, headers={'User-Agent': USER_AGENT})
+        self._count(len(response.body))
+        return response.read().decode()
+
+    async def scan(self, url, scanner):
+        try:
+            await engine.instance.fetch(url, headers={'User-Agent': USER_AGENT}, until=scanner.feed)
+        finally:
+            self._count(scanner.bytes)
+        scanner.close()
+        return scanner
+
+    async def fetch_json(self, url):
+        return json.loads(await self.fetch_text(url))
+
+    async def _resolve(self, matches):
+        return await asyncio.gather(*[self.get_album_art(match=match) for match in matches])
+
     def media_items(self, iframes, fetch_album_art=False, fetch_yt_video=False):
         matches = []
         self.fetch_yt_video = fetch_yt_video
@@ -572,38 +1271,24 @@ class ExternalMedia:
                 'plugin':     plugin if plugin_match else None,
             })
 
-        if fetch_album_art:
-            executor = ThreadPoolExecutor(max_workers=3)
-            art_exec = [executor.submit(self.get_album_art, match=match) for match in matches]
-            matches = [match.result() for match in art_exec]
+        if fetch_album_art and matches:
+            matches = engine.instance.run(self._resolve(matches))
 
         return matches
 
-    def get_album_art(self, match={}):
+    async def get_album_art(self, match={}):
         result = match
         media_id, plugin = match['media_id'], match['plugin']
         album_art = {}
-        if plugin == 'bandcamp':
-            album_art = self.bandcamp_album_art(media_id)
-        elif plugin == 'bandcamp_link':
-            album_art = self.bandcamp_track_art(media_id)
-        elif plugin == 'bandcamp_band_link':
-            album_art = self.bandcamp_band_art(media_id)
-        elif plugin == 'bandcamp_track':
-            album_art = self.bandcamp_track_art(media_id)
-        elif plugin == 'indigitube':
-            album_art = self.indigitube_album_art(media_id)
-        elif plugin == 'spotify' or plugin == 'spotify_playlist':
-            album_art = self.spotify_album_art(match['src'])
-        elif plugin == 'apple':
-            album_art = self.apple_album_art(media_id)
-        elif plugin == 'youtube_playlist':
-            album_art = self.youtube_playlist_art(media_id)
-        elif plugin == 'youtube' or plugin == 'youtube_art':
+        if plugin == 'youtube' or plugin == 'youtube_art':
             result['plugin'] = 'youtube'
             if self.fetch_yt_video:
-                album_art = self.youtube_video_duration(media_id)
+                album_art = await self.metadata('youtube', media_id, media_id)
             album_art['art'] = self.YOUTUBE_VIDEO_ART_URL_FORMAT.format(media_id)
+        elif plugin == 'spotify' or plugin == 'spotify_playlist':
+            album_art = await self.metadata(plugin, media_id, match['src'])
+        elif plugin in self.STRATEGIES:
+            album_art = await self.metadata(plugin, media_id, media_id)
 
         result['thumbnail']  = album_art.get('art')
         result['background'] = album_art.get('band')
@@ -618,6 +1303,66 @@ class ExternalMedia:
             result['attrs']['textbody'] = album_art.get('textbody')
         return result
 
+    async def metadata(self, plugin, media_id, key):
+        '''
+        lookup() through media_cache, with one lookup in flight per media id
+        however many embeds on a page share it.
+        '''
+        cache_key = f'{plugin}:{media_id}'
+        cached = media_cache.get(cache_key) if media_cache else None
+        if cached is not None:
+            self.record(plugin, 'cache', 0, 0.0)
+            self.costs[(plugin, 'cache')]['filled'] += len([value for value in cached.values() if value])
+            return dict(cached)
+
+        pending = self._pending.get(cache_key)
+        if pending is None:
+            pending = self._pending[cache_key] = asyncio.ensure_future(self.lookup(plugin, key))
+            pending.add_done_callback(lambda _: self._pending.pop(cache_key, None))
+            owner = True
+        else:
+            owner = False
+        album_art = await asyncio.shield(pending)
+
+        # failed lookups come back empty and are tried again next time
+        if owner and media_cache and any(album_art.values()):
+            media_cache.set(cache_key, album_art, self.MEDIA_MAX_AGE)
+        return dict(album_art)
+
+    async def lookup(self, plugin, key):
+        strategies = self.STRATEGIES[plugin]
+        wanted = set().union(*[provides for _, provides, _ in strategies])
+        result = {}
+        for i, (name, provides, method) in enumerate(strategies):
+            missing = wanted - {field for field, value in result.items() if value}
+            if not missing & set(provides):
+                continue
+            # a later strategy that has to run anyway and fills everything makes this one redundant
+            if not missing <= set(provides) and any(missing <= set(later) for _, later, _ in strategies[i + 1:]):
+                continue
+
+            fetched = [0]
+            token = self._fetched.set(fetched)
+            start = time.monotonic()
+            try:
+                values = await getattr(self, method)(key)
+            finally:
+                self._fetched.reset(token)
+                self.record(plugin, name, fetched[0], time.monotonic() - start)
+
+            filled = [field for field, value in values.items() if value and not result.get(field)]
+            self.costs[(plugin, name)]['filled'] += len(filled)
+            for field, value in values.items():
+                if not result.get(field):
+                    result[field] = value
+        return result
+
+    def record(self, plugin, strategy, nbytes, seconds):
+        cost = self.costs.setdefault((plugin, strategy), {'requests': 0, 'bytes': 0, 'seconds': 0.0, 'filled': 0})
+        cost['requests'] += 1
+        cost['bytes']    += nbytes
+        cost['seconds']  += seconds
+
     def get_sum_duration(self, duration_matches):
         durations = [int(x.split(':')[0]) * 60 + int(x.split(':')[1]) for x in duration_matches]
         return sum(durations)
@@ -632,10 +1377,10 @@ class ExternalMedia:
             result += int(duration['seconds'][:-1])
         return result
 
-    def bandcamp_album_art(self, album_id):
+    async def bandcamp_album_art(self, album_id):
         api_url  = self.BANDCAMP_ALBUM_ART_URL.format(album_id)
         try:
-            json_obj = get_json_obj(api_url)
+            json_obj = await self.fetch_json(api_url)
         except URLError as e:
             return {}
 
@@ -655,61 +1400,70 @@ class ExternalMedia:
             result['duration'] = int(duration)
         return result
 
-    def bandcamp_track_art(self, track_url):
+    async def bandcamp_track_art(self, track_url):
+        fields = {
+            'art':    self.RE_BANDCAMP_TRACK_ART,
+            'band':   self.RE_BANDCAMP_TRACK_BAND_ART,
+            'title':  self.RE_BANDCAMP_TRACK_TITLE,
+            'artist': self.RE_BANDCAMP_TRACK_ARTIST,
+            'data':   self.RE_BANDCAMP_TRACK_DATA,
+        }
+        scanner = PageScanner(first=fields, every={'duration': self.RE_BANDCAMP_TRACK_DURATION}, until=fields)
         try:
-            track_page = get_json(track_url)
+            await self.scan(track_url, scanner)
         except URLError as e:
             return {}
 
-        art_match        = re.search(self.RE_BANDCAMP_TRACK_ART, track_page)
-        band_match       = re.search(self.RE_BANDCAMP_TRACK_BAND_ART, track_page)
-        title_match      = re.search(self.RE_BANDCAMP_TRACK_TITLE, track_page)
-        artist_match     = re.search(self.RE_BANDCAMP_TRACK_ARTIST, track_page)
-        duration_matches = re.finditer(self.RE_BANDCAMP_TRACK_DURATION, track_page)
+        art_match, band_match = scanner.first['art'], scanner.first['band']
+        title_match, artist_match = scanner.first['title'], scanner.first['artist']
         result = {}
         if art_match:
-            art_id  = art_match.groupdict().get('art_id')
+            art_id  = art_match.get('art_id')
             result['art']  = f'https://f4.bcbits.com/img/a{art_id}_5.jpg'
         if band_match:
-            band_id = band_match.groupdict().get('band_art_id')
+            band_id = band_match.get('band_art_id')
             result['band'] = f'https://f4.bcbits.com/img/{band_id}_20.jpg'
         if title_match:
-            result['title'] = title_match.groupdict().get('title', '').strip()
+            result['title'] = title_match.get('title', '').strip()
         if artist_match:
-            result['artist'] = artist_match.groupdict().get('artist')
+            result['artist'] = artist_match.get('artist')
 
         duration = 0.0
-        for match in duration_matches:
-            duration += float(match.groupdict().get('duration', '0'))
+        for match in scanner.every['duration']:
+            duration += float(match.get('duration', '0'))
         result['duration'] = int(duration)
 
         return result
 
-    def bandcamp_band_art(self, track_url):
+    async def bandcamp_band_art(self, track_url):
+        fields = {
+            'band':   self.RE_BANDCAMP_TRACK_BAND_ART,
+            'artist': self.RE_BANDCAMP_TRACK_ARTIST,
+        }
+        scanner = PageScanner(first=fields, until=fields)
         try:
-            track_page = get_json(track_url)
+            await self.scan(track_url, scanner)
         except URLError as e:
             return {}
 
-        band_match       = re.search(self.RE_BANDCAMP_TRACK_BAND_ART, track_page)
-        artist_match     = re.search(self.RE_BANDCAMP_TRACK_ARTIST, track_page)
+        band_match, artist_match = scanner.first['band'], scanner.first['artist']
         result = {}
         if band_match:
-            band_id = band_match.groupdict().get('band_art_id')
+            band_id = band_match.get('band_art_id')
             result['band'] = f'https://f4.bcbits.com/img/{band_id}_20.jpg'
             result['art']  = result['band']
         if artist_match:
-            result['artist'] = artist_match.groupdict().get('artist')
+            result['artist'] = artist_match.get('artist')
             result['title'] = result['artist']
 
         return result
 
-    def indigitube_album_art(self, album_id):
+    async def indigitube_album_art(self, album_id):
         api_url  = self.INDIGITUBE_ALBUM_URL.format(album_id)
         result = {}
 
         try:
-            json_obj = get_json_obj(api_url)
+            json_obj = await self.fetch_json(api_url)
         except URLError as e:
             return result
 
@@ -726,88 +1480,110 @@ class ExternalMedia:
 
         return result
 
-    def youtube_video_duration(self, video_id):
+    async def youtube_video_duration(self, video_id):
         video_url = self.YOUTUBE_VIDEO_DURATION_URL.format(video_id)
+        fields = {
+            'duration': self.RE_YOUTUBE_VIDEO_DURATION,
+            'title':    self.RE_YOUTUBE_VIDEO_TITLE,
+            'artist':   self.RE_YOUTUBE_VIDEO_ARTIST,
+            'textbody': self.RE_YOUTUBE_VIDEO_DESC,
+        }
+        scanner = PageScanner(first=fields, until=fields)
         try:
-            video_page  = get_json(video_url)
+            await self.scan(video_url, scanner)
         except URLError as e:
             return {}
 
-        duration_match  = re.search(self.RE_YOUTUBE_VIDEO_DURATION, video_page)
-        title_match     = re.search(self.RE_YOUTUBE_VIDEO_TITLE, video_page)
-        artist_match    = re.search(self.RE_YOUTUBE_VIDEO_ARTIST, video_page)
-        desc_match      = re.search(self.RE_YOUTUBE_VIDEO_DESC, video_page)
+        duration_match, title_match = scanner.first['duration'], scanner.first['title']
+        artist_match, desc_match    = scanner.first['artist'], scanner.first['textbody']
         result = {'duration': 0}
         if duration_match:
-            gd = duration_match.groupdict()
-            result['duration'] = self.get_pt_duration(gd)
+            result['duration'] = self.get_pt_duration(duration_match)
         if title_match:
-            result['title'] = title_match.groupdict().get('title', '').strip()
+            result['title'] = title_match.get('title', '').strip()
         if artist_match:
-            result['artist'] = artist_match.groupdict().get('artist', '').strip()
+            result['artist'] = artist_match.get('artist', '').strip()
         if desc_match:
-            result['textbody'] = html.unescape(desc_match.groupdict().get('textbody', '').strip())
+            result['textbody'] = html.unescape(desc_match.get('textbody', '').strip())
 
         return result
 
-    def youtube_playlist_art(self, playlist_id):
+    # playlist, spotify and apple pages are read to the end for their durations,
+    # and one search per pattern over the whole page beats the PageScanner there
+    async def youtube_playlist_art(self, playlist_id):
         api_url = self.YOUTUBE_PLAYLIST_ART_URL.format(playlist_id)
         try:
-            playlist_page = get_json(api_url)
+            playlist_page = await self.fetch_text(api_url)
         except URLError as e:
             return {}
 
-        art_match        = re.search(self.RE_YOUTUBE_PLAYLIST_ART, playlist_page)
-        duration_matches = re.findall(self.RE_YOUTUBE_PLAYLIST_DURATION, playlist_page)
-        title_match     = re.search(self.RE_YOUTUBE_PLAYLIST_TITLE, playlist_page)
-        artist_match    = re.search(self.RE_YOUTUBE_PLAYLIST_ARTIST, playlist_page)
+        art_match        = self.RE_YOUTUBE_PLAYLIST_ART.search(playlist_page)
+        duration_matches = self.RE_YOUTUBE_PLAYLIST_DURATION.findall(playlist_page)
+        title_match      = self.RE_YOUTUBE_PLAYLIST_TITLE.search(playlist_page)
+        artist_match     = self.RE_YOUTUBE_PLAYLIST_ARTIST.search(playlist_page)
 
         result = {}
         if art_match:
-            result['art'] = art_match.groupdict().get('art_url').replace('&amp;', '&') + '&ext=.jpg'
+            result['art'] = art_match['art_url'].replace('&amp;', '&') + '&ext=.jpg'
         else:
-            art_match = re.search(self.RE_YOUTUBE_PLAYLIST_ART_LQ, playlist_page)
-            result['art'] = art_match.groupdict().get('art_url')
+            art_match = self.RE_YOUTUBE_PLAYLIST_ART_LQ.search(playlist_page)
+            result['art'] = art_match['art_url'] if art_match else None
         if duration_matches:
             result['duration'] = self.get_sum_duration(duration_matches)
         if title_match:
-            result['title'] = html.unescape(title_match.groupdict().get('title', '').strip())
+            result['title'] = html.unescape(title_match['title'].strip())
         if artist_match:
-            result['artist'] = html.unescape(artist_match.groupdict().get('artist', '').strip())
+            result['artist'] = html.unescape(artist_match['artist'].strip())
         return result
 
-    def spotify_album_art(self, src):
+    async def spotify_album_art(self, src):
         api_url = src
         try:
-            spotify_page = get_json(api_url)
+            spotify_page = await self.fetch_text(api_url)
         except URLError as e:
             return {}
 
-        art_match        = re.search(self.RE_SPOTIFY_ALBUM_ART, spotify_page)
-        duration_matches = re.findall(self.RE_SPOTIFY_DURATION, spotify_page)
+        art_match        = self.RE_SPOTIFY_ALBUM_ART.search(spotify_page)
+        duration_matches = self.RE_SPOTIFY_DURATION.findall(spotify_page)
 
         result = {}
         if art_match:
-            result['art'] = art_match.groupdict().get('art_url')
+            result['art'] = art_match['art_url']
         if duration_matches:
             result['duration'] = self.get_sum_duration(duration_matches)
         return result
 
-    def apple_album_art(self, album_id):
+    async def apple_album_lookup(self, album_id):
+        number = self.RE_APPLE_ALBUM_NUMBER.search(album_id)
+        if not number:
+            return {}
+        try:
+            json_obj = await self.fetch_json(self.APPLE_LOOKUP_URL.format(number['album_id']))
+        except (URLError, ValueError) as e:
+            return {}
+
+        result = {'duration': 0}
+        for item in json_obj.get('results', []):
+            if item.get('wrapperType') == 'collection' and item.get('artworkUrl100'):
+                result['art'] = self.RE_APPLE_ART_SIZE.sub('/600x600bf-60.jpg', item['artworkUrl100'])
+            elif item.get('wrapperType') == 'track':
+                result['duration'] += round(item.get('trackTimeMillis', 0) / 1000)
+
+        return result
+
+    async def apple_album_art(self, album_id):
         api_url = self.APPLE_ALBUM_URL.format(album_id)
         try:
-            album_page  = get_json(api_url)
+            album_page = await self.fetch_text(api_url)
         except URLError as e:
             return {}
 
-        art_match       = re.search(self.RE_APPLE_ALBUM_ART, album_page)
-        duration_match  = re.finditer(self.RE_APPLE_DURATION, album_page)
+        art_match = self.RE_APPLE_ALBUM_ART.search(album_page)
         result = {'duration': 0}
 
         if art_match:
-            result['art'] = art_match.groupdict().get('art_url')
-        for duration in duration_match:
-            gd = duration.groupdict()
+            result['art'] = art_match['art_url']
+        for duration in self.RE_APPLE_DURATION.finditer(album_page):
             result['duration'] += self.get_pt_duration(duration)
 
         return result
@@ -851,26 +1627,24 @@ class FeaturedAlbumScraper(Scraper, ExternalMedia):
             duration   = album.get('duration')
 
         data = [
-            {
-                'type': album_type,
-                'id': album_id,
-                'attributes': {
-                    'title':     album_title,
-                    'artist':    album_artist,
-                    'textbody':  album_copy,
-                    'duration':  duration,
-                },
-                'links': {
+            Item(
+                type     = album_type,
+                id       = album_id,
+                title    = album_title,
+                artist   = album_artist,
+                textbody = album_copy,
+                duration = duration,
+                links    = {
                     'self': self.path,
                 }
-            }
+            )
         ]
 
         if album_image:
-            data[0]['attributes']['thumbnail']  = album_image.attrs.get('src')
+            data[0].thumbnail  = album_image.attrs.get('src')
 
         if background:
-            data[0]['attributes']['background'] = background
+            data[0].background = background
 
         return {
             'data': data,
@@ -881,29 +1655,23 @@ class FeaturedAlbumScraper(Scraper, ExternalMedia):
 class FeaturedAlbumsScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/featured_albums'
     WEBSITE_PATH_PATTERN = '/explore/album-of-the-week'
+    PARSE_ONLY = bs4.SoupStrainer('div', class_='card clearfix')
 
-    def generate(self):
-        return {
-            'data': [
-                FeaturedAlbum(item).to_dict()
-                for item in self.soup().findAll('div', class_='card clearfix')
-            ],
-            'links': self.pagination()
-        }
+    def stream(self):
+        for item in self.soup().findAll('div', class_='card clearfix'):
+            yield FeaturedAlbum(item).to_item()
+        return self.pagination()
 
 
 class NewsItemsScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/news_items'
     WEBSITE_PATH_PATTERN = '/explore/news-articles'
+    PARSE_ONLY = bs4.SoupStrainer(class_='list-view__item')
 
-    def generate(self):
-        return {
-            'data': [
-                News(item).to_dict()
-                for item in self.soup().findAll(class_='list-view__item')
-            ],
-            'links': self.pagination(),
-        }
+    def stream(self):
+        for item in self.soup().findAll(class_='list-view__item'):
+            yield News(item).to_item()
+        return self.pagination()
 
 
 class NewsItemScraper(Scraper):
@@ -914,6 +1682,7 @@ class NewsItemScraper(Scraper):
 class ProgramBroadcastScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/programs/{program_id}/broadcasts/{item}'
     WEBSITE_PATH_PATTERN = '/explore/programs/{program_id}/episodes/{item}'
+    MAX_AGE = 24 * 60 * 60
 
     def generate(self):
         soup = self.soup()
@@ -922,25 +1691,27 @@ class ProgramBroadcastScraper(Scraper):
 
         broadcast = ProgramBroadcast(
             soup.find(class_='audio-summary')
-        ).to_dict()
-        broadcast['attributes']['textbody'] = soup.find(class_='page-banner__summary').text
+        ).to_item()
+        broadcast.textbody = soup.find(class_='page-banner__summary').text
 
         segments = [
-            ProgramBroadcastSegment(item).to_dict()
+            ProgramBroadcastSegment(item).to_item()
             for item in soup.findAll(class_='episode-detail__highlights-item')
         ]
 
         tracks = [
-            ProgramBroadcastTrack(item).to_dict()
+            ProgramBroadcastTrack(item)
             for item in soup.findAll(class_='audio-summary__track clearfix')
         ]
+        ProgramBroadcastTrack.resolve_media(tracks)
+        tracks = [track.to_item() for track in tracks]
 
         items = []
         for item in ([broadcast] + segments + tracks):
             if not item:
                 continue
-            if programbg and not item.get('attributes', {}).get('background'):
-                item['attributes']['background'] = programbg
+            if programbg and not item.background:
+                item.background = programbg
             items.append(item)
 
         return {
@@ -951,6 +1722,7 @@ class ProgramBroadcastScraper(Scraper):
 class ProgramPodcastScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/programs/{program_id}/podcasts/{item}'
     WEBSITE_PATH_PATTERN = '/explore/podcasts/{program_id}/episodes/{item}'
+    MAX_AGE = 24 * 60 * 60
 
     def generate(self):
         return {'data': []}
@@ -959,6 +1731,7 @@ class ProgramPodcastScraper(Scraper):
 class ProgramSegmentScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/segments/{item}'
     WEBSITE_PATH_PATTERN = '/on-demand/segments/{item}'
+    MAX_AGE = 24 * 60 * 60
 
     def generate(self):
         return {'data': []}
@@ -967,46 +1740,46 @@ class ProgramSegmentScraper(Scraper):
 class ScheduleScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/schedule'
     WEBSITE_PATH_PATTERN = '/explore/schedule'
+    PARSE_ONLY = bs4.SoupStrainer(class_=['list-view__item', 'calendar__hidden-input', 'page-nav__item'])
 
-    def generate(self):
+    # the station's broadcast day runs until 6am
+    DAY_START = timedelta(hours=6)
+
+    def max_age(self):
+        # past days no longer change, today's carries the on air flags
+        date = parse_qs(self.groupdict.get('query_params') or '').get('date', [''])[0]
+        today = (clock.local_now() - self.DAY_START).strftime(DATE_FORMAT)
+        return NO_EXPIRY if date and date < today else 0
+
+    def stream(self):
         soup = self.soup()
         date = soup.find(class_='calendar__hidden-input').attrs.get('value')
         prevdate, nextdate = [x.find('a').attrs.get('href').split('=')[-1] for x in soup.findAll(class_='page-nav__item')]
-        return {
-            'data': [
-                ScheduleItem(item).to_dict()
-                for item in self.soup().findAll(class_='list-view__item')
-            ],
-            'links': self.pagination(pagekey='date', selfval=date, nextval=prevdate),
-        }
+        for item in soup.findAll(class_='list-view__item'):
+            yield ScheduleItem(item).to_item()
+        return self.pagination(pagekey='date', selfval=date, nextval=prevdate)
 
 
 class SearchScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/search'
     WEBSITE_PATH_PATTERN = '/search'
+    PARSE_ONLY = bs4.SoupStrainer(class_='search-result')
 
-    def generate(self):
-        return {
-            'data': [
-                SearchItem(item).to_dict()
-                for item in self.soup().findAll(class_='search-result')
-            ],
-            'links': self.pagination(),
-        }
+    def stream(self):
+        for item in self.soup().findAll(class_='search-result'):
+            yield SearchItem(item).to_item()
+        return self.pagination()
 
 
 class SoundscapesScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/soundscapes'
     WEBSITE_PATH_PATTERN = '/explore/soundscape'
+    PARSE_ONLY = bs4.SoupStrainer(class_='list-view__item')
 
-    def generate(self):
-        return {
-            'data': [
-                Soundscape(item).to_dict()
-                for item in self.soup().findAll(class_='list-view__item')
-            ],
-            'links': self.pagination()
-        }
+    def stream(self):
+        for item in self.soup().findAll(class_='list-view__item'):
+            yield Soundscape(item).to_item()
+        return self.pagination()
 
 
 class SoundscapeScraper(Scraper, ExternalMedia):
@@ -1078,9 +1851,7 @@ class SoundscapeScraper(Scraper, ExternalMedia):
                     media.get('attrs').get('featured_album')
                 ).strip()
 
-            dataitem['attributes'] = attributes
-
-            data.append(dataitem)
+            data.append(Item.from_attributes(dataitem.get('type'), dataitem['id'], attributes))
 
         return {
             'data': data,
@@ -1088,14 +1859,16 @@ class SoundscapeScraper(Scraper, ExternalMedia):
 
 
 class Program(Resource):
-    @property
+    __slots__ = ('__path', '__title')
+
+    @memoised
     def path(self):
         return f"{Scraper.resource_path_for(self._itemobj.find('a').attrs['href'])}/broadcasts?page=1"
 
     def id(self):
         return self.path.split("/")[2]
 
-    @property
+    @memoised
     def title(self):
         return self._itemobj.find('h1', class_='card__title' ).find('a').text
 
@@ -1112,7 +1885,9 @@ class Program(Resource):
 
 
 class Topic(Resource):
-    @property
+    __slots__ = ('__title',)
+
+    @memoised
     def title(self):
         return self._itemobj.find('a').text
 
@@ -1125,44 +1900,36 @@ class Topic(Resource):
 class TopicsScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/topics'
     WEBSITE_PATH_PATTERN = '/'
+    MAX_AGE = 6 * 60 * 60
+    PARSE_ONLY = bs4.SoupStrainer(class_='topic-list__item')
 
-    def generate(self):
+    def stream(self):
+        for item in self.soup().findAll(class_='topic-list__item'):
+            yield Topic(item).to_item()
         return {
-            'data': [
-                Topic(item).to_dict()
-                for item in self.soup().findAll(class_='topic-list__item')
-            ],
-            'links': {
-                'self': self.__class__.RESOURCE_PATH_PATTERN
-            },
+            'self': self.__class__.RESOURCE_PATH_PATTERN
         }
 
 
 class TopicScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/topics/{topic}'
     WEBSITE_PATH_PATTERN = '/topics/{topic}'
+    PARSE_ONLY = bs4.SoupStrainer(class_='search-result')
 
-    def generate(self):
-        return {
-            'data': [
-                SearchItem(item).to_dict()
-                for item in self.soup().findAll(class_='search-result')
-            ],
-            'links': self.pagination(),
-        }
+    def stream(self):
+        for item in self.soup().findAll(class_='search-result'):
+            yield SearchItem(item).to_item()
+        return self.pagination()
 
 
 class TracksSearchScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/tracks/search'
     WEBSITE_PATH_PATTERN = '/tracks/search'
+    PARSE_ONLY = bs4.SoupStrainer(class_='search-result')
 
-    def generate(self):
-        return {
-            'data': [
-                BroadcastTrack(item).to_dict()
-                for item in self.soup().findAll(class_='search-result')
-            ],
-        }
+    def stream(self):
+        for item in self.soup().findAll(class_='search-result'):
+            yield BroadcastTrack(item).to_item()
 
 
 class TrackScraper(Scraper):
@@ -1174,7 +1941,10 @@ class TrackScraper(Scraper):
 
 
 class Track(Resource):
+    __slots__ = ('_path', 'artist', 'title')
+
     def __init__(self, path, artist, title):
+        super().__init__(None)
         self._path = path
         self.artist = artist
         self.title = title
@@ -1196,15 +1966,12 @@ class Track(Resource):
 class EventsScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/events'
     WEBSITE_PATH_PATTERN = '/events'
+    PARSE_ONLY = bs4.SoupStrainer('div', class_='card')
 
-    def generate(self):
-        return {
-            'data': [
-                Event(item).to_dict()
-                for item in self.soup().findAll('div', class_='card')
-            ],
-            'links': self.pagination()
-        }
+    def stream(self):
+        for item in self.soup().findAll('div', class_='card'):
+            yield Event(item).to_item()
+        return self.pagination()
 
 
 class EventScraper(Scraper, ExternalMedia):
@@ -1231,44 +1998,39 @@ class EventScraper(Scraper, ExternalMedia):
 
         result = {
             'data': [
-                {
-                    'type':       event_type,
-                    'id':         Resource.id(self),
-                    'attributes': {
-                        'title':    item.find(class_='event__title').text,
-                        'venue':    venue.get_text(' ') if venue else '',
-                        'textbody': '\n'.join((eventdetails, textbody)),
-                    },
-                    'links': {
+                Item(
+                    type     = event_type,
+                    id       = Resource.id(self),
+                    title    = item.find(class_='event__title').text,
+                    venue    = venue.get_text(' ') if venue else '',
+                    textbody = '\n'.join((eventdetails, textbody)),
+                    links    = {
                         'self': self.resource_path,
                     }
-                }
+                )
             ],
         }
 
-        for link in copy.find_all(['a', 'iframe']):
-            link_href = {
+        links = [
+            {
                 'src': link.attrs.get('href', link.attrs.get('src')),
             }
-            media = self.media_items([link_href], fetch_album_art=True, fetch_yt_video=True)[0]
+            for link in copy.find_all(['a', 'iframe'])
+        ]
+        for media in self.media_items(links, fetch_album_art=True, fetch_yt_video=True):
             if media.get('plugin'):
-                dataitem = {}
-                if media.get('plugin'):
-                    dataitem['id'] = media.get('media_id')
-                    dataitem['type'] = media.get('plugin')
-                else:
-                    dataitem['id'] = ''
-
-                dataitem['attributes'] = {
-                    'thumbnail':  media.get('thumbnail'),
-                    'background': media.get('background'),
-                    'duration':   media.get('duration'),
-                    'title':      media.get('attrs').get('title'),
-                    'textbody':   media.get('attrs').get('textbody', media.get('attrs').get('title')),
-                    'artist':     media.get('attrs').get('artist'),
-                }
-
-                result['data'].append(dataitem)
+                result['data'].append(
+                    Item(
+                        type       = media.get('plugin'),
+                        id         = media.get('media_id'),
+                        thumbnail  = media.get('thumbnail'),
+                        background = media.get('background'),
+                        duration   = media.get('duration'),
+                        title      = media.get('attrs').get('title'),
+                        textbody   = media.get('attrs').get('textbody', media.get('attrs').get('title')),
+                        artist     = media.get('attrs').get('artist'),
+                    )
+                )
 
         return result
 
@@ -1276,14 +2038,11 @@ class EventScraper(Scraper, ExternalMedia):
 class GiveawaysScraper(Scraper):
     RESOURCE_PATH_PATTERN = '/giveaways'
     WEBSITE_PATH_PATTERN = '/subscriber-giveaways'
+    PARSE_ONLY = bs4.SoupStrainer(class_='list-view__item')
 
-    def generate(self):
-        return {
-            'data': [
-                Giveaway(item).to_dict()
-                for item in self.soup().findAll(class_='list-view__item')
-            ],
-        }
+    def stream(self):
+        for item in self.soup().findAll(class_='list-view__item'):
+            yield Giveaway(item).to_item()
 
 
 class GiveawayScraper(Scraper):
@@ -1302,18 +2061,16 @@ class GiveawayScraper(Scraper):
 
         return {
             'data': [
-                {
-                    'type': 'giveaway',
-                    'id':   Resource.id(self),
-                    'attributes': {
-                        'title':     banner.find(class_='compact-banner__heading').text,
-                        'textbody':  f'{closes}\n\n{textbody}',
-                        'thumbnail': item.find(class_='summary-inset__artwork').attrs.get('src'),
-                    },
-                    'links': {
+                Item(
+                    type      = 'giveaway',
+                    id        = Resource.id(self),
+                    title     = banner.find(class_='compact-banner__heading').text,
+                    textbody  = f'{closes}\n\n{textbody}',
+                    thumbnail = item.find(class_='summary-inset__artwork').attrs.get('src'),
+                    links     = {
                         'self':  '/'.join((self.resource_path, 'entries')),
                     }
-                }
+                )
             ],
         }
 
@@ -1378,9 +2135,7 @@ class VideosScraper(Scraper, ExternalMedia):
 
             attributes['textbody'] = media.get('attrs').get('title').strip()
 
-            dataitem['attributes'] = attributes
-
-            data.append(dataitem)
+            data.append(Item.from_attributes(dataitem.get('type'), dataitem['id'], attributes))
 
         return {
             'data': data,
@@ -1392,7 +2147,9 @@ class VideosScraper(Scraper, ExternalMedia):
 ### Scrapers ##############################################
 
 class FeaturedAlbum(Resource):
-    @property
+    __slots__ = ('__title',)
+
+    @memoised
     def title(self):
         return self._itemobj.find('h1', class_='card__title' ).find('a').text
 
@@ -1414,7 +2171,9 @@ class FeaturedAlbum(Resource):
 
 
 class Giveaway(Resource):
-    @property
+    __slots__ = ('__title',)
+
+    @memoised
     def title(self):
         return self._itemobj.find('span').text
 
@@ -1431,7 +2190,9 @@ class Giveaway(Resource):
 
 
 class News(Resource):
-    @property
+    __slots__ = ('__title',)
+
+    @memoised
     def title(self):
         return self._itemobj.find(class_='list-view__title').text
 
@@ -1451,7 +2212,9 @@ class News(Resource):
 
 
 class Soundscape(Resource):
-    @property
+    __slots__ = ('__title',)
+
+    @memoised
     def title(self):
         return self._itemobj.find('span').text.replace(':', '').replace('Triple R ', '')
 
@@ -1473,7 +2236,9 @@ class Soundscape(Resource):
 
 
 class Event(Resource):
-    @property
+    __slots__ = ('___itemtitle', '__label', '___itemtype', '__img', '___itemdate', '__venue')
+
+    @memoised
     def _itemtitle(self):
         return self._itemobj.find(class_='card__title').find('a').text
 
@@ -1484,12 +2249,12 @@ class Event(Resource):
         else:
             return ' - '.join((self._itemtitle, self._itemdate))
 
-    @property
+    @memoised
     def label(self):
         label = self._itemobj.find(class_='card__label')
         return label.text if label else ''
 
-    @property
+    @memoised
     def _itemtype(self):
         return self._itemobj.find(class_='card__meta').find('div').text
 
@@ -1497,11 +2262,11 @@ class Event(Resource):
     def type(self):
         return self._itemtype.replace(' ', '-').lower()
 
-    @property
+    @memoised
     def img(self):
         return self._itemobj.find('a', class_='card__anchor').find('img')
 
-    @property
+    @memoised
     def _itemdate(self):
         meta = self._itemobj.find('span', class_='card__meta')
         metadiv = meta.findAll('div')
@@ -1510,7 +2275,7 @@ class Event(Resource):
         else:
             return meta.text if meta else ''
 
-    @property
+    @memoised
     def venue(self):
         meta = self._itemobj.find('span', class_='card__meta')
         metadiv = meta.findAll('div')
@@ -1532,11 +2297,13 @@ class Event(Resource):
 
 
 class ScheduleItem:
+    __slots__ = ('_itemobj', '_audio_item', '__path')
+
     def __init__(self, itemobj):
         self._itemobj = itemobj
         self._audio_item = AudioItem.factory(itemobj)
 
-    @property
+    @memoised
     def path(self):
         path = Scraper.resource_path_for(self._itemobj.find('a').attrs['href'])
         segments = path.split('?')[0].split('/')
@@ -1556,14 +2323,9 @@ class ScheduleItem:
     @property
     def _on_air_status(self):
         if self.start and self.end and '+' in self.start:
-            start = self.start.split('+')
-            end   = self.end.split('+')
-            td    = timedelta(hours=int(start[1][:2]))
             try:
-                start = strptime(start[0], '%Y-%m-%dT%H:%M:%S') - td
-                end   = strptime(end[0],   '%Y-%m-%dT%H:%M:%S') - td
-                return start, end
-            except (ValueError, TypeError) as e:
+                return clock.utc_span(self.start, self.end)
+            except (ValueError, TypeError):
                 pass
         return None, None
 
@@ -1573,17 +2335,17 @@ class ScheduleItem:
 
     @property
     def duration(self):
-        if self.audio_item:
-            return self.audio_item.get('attributes').get('duration')
+        if self._audio_item:
+            return self._audio_item.duration
 
     @property
     def content(self):
         content = json.loads(self._itemobj.find(class_='hide-from-all').attrs['data-content'])
         content['title'] = content.pop('name')
 
-        if self.audio_item:
+        if self._audio_item:
             content['type'] = 'broadcast_index'
-            content['title'] = self.audio_item.get('attributes').get('title')
+            content['title'] = self._audio_item.title
         else:
             if '/broadcasts?page=1' not in self.path:
                 content['type'] = 'broadcast_index'
@@ -1594,7 +2356,7 @@ class ScheduleItem:
 
         start, end = self._on_air_status
         if (not ignore_on_air) and start and end:
-            localtime = datetime.utcnow()
+            localtime = clock.now()
             if start < localtime and end > localtime:
                 flag_label = self._itemobj.find(class_='flag-label__on-air').next_sibling
                 if flag_label:
@@ -1605,11 +2367,7 @@ class ScheduleItem:
 
         return content
 
-    @property
-    def audio_item(self):
-        return self._audio_item or {}
-
-    def to_dict(self):
+    def to_item(self):
         attrs = {
             **self.content,
             'start': self.start,
@@ -1620,14 +2378,17 @@ class ScheduleItem:
         itemid = attrs.pop('id')
         itemtype = attrs.pop('type')
 
-        return {
-            'type': itemtype,
-            'id': itemid,
-            'attributes': attrs,
-            'links': {
+        return Item.from_attributes(
+            itemtype,
+            itemid,
+            attrs,
+            {
                 'self': self.path
             }
-        }
+        )
+
+    def to_dict(self):
+        return self.to_item().to_dict()
 
 
 class ItemType:
@@ -1643,6 +2404,8 @@ class ItemType:
 
 
 class SearchItem(Resource):
+    __slots__ = ()
+
     @property
     def type(self):
         return ItemType.from_label(self._itemobj.find(class_='flag-label').text)
@@ -1665,6 +2428,8 @@ class SearchItem(Resource):
 
 
 class BroadcastTrack(Resource):
+    __slots__ = ('__played', '__track')
+
     def id(self):
         return f'{SearchItem.id(self)}.{self.track.id()}'
 
@@ -1673,19 +2438,19 @@ class BroadcastTrack(Resource):
         return f'{self.track.artist} - {self.track.title} (Broadcast on {self.broadcast_date} by {self.program_title})'
 
     RE = re.compile(r'Played (?P<played_date>[^/]+) by (?P<played_by>.+)View all plays$')
-    @property
+    @memoised
     def played(self):
         return self.RE.match(self._itemobj.find(class_='search-result__meta-info').text)
 
     @property
     def broadcast_date(self):
-        return time.strftime(DATE_FORMAT, time.strptime(self.played['played_date'], '%A %d %b %Y'))
+        return clock.reformat(self.played['played_date'], '%A %d %b %Y', DATE_FORMAT)
 
     @property
     def program_title(self):
         return self.played['played_by']
 
-    @property
+    @memoised
     def track(self):
         return Track(
             Scraper.resource_path_for(self._itemobj.find(class_='search-result__meta-links').find('a').attrs['href']),
@@ -1731,7 +2496,9 @@ class BroadcastTrack(Resource):
 
 
 class PlayableResource(Resource):
-    @property
+    __slots__ = ('___playable', '___on_air_toggle', '__title')
+
+    @memoised
     def _playable(self):
         view_playable_div = self._itemobj.find(lambda tag:tag.name == 'div' and 'data-view-playable' in tag.attrs)
         if view_playable_div:
@@ -1747,7 +2514,7 @@ class PlayableResource(Resource):
     def _audio_data(self):
         return self._data.get('audio_file', {})
 
-    @property
+    @memoised
     def _on_air_toggle(self):
         dataview = self._itemobj.attrs.get('data-view-on-air-toggle')
         if dataview:
@@ -1757,14 +2524,9 @@ class PlayableResource(Resource):
     def _on_air_status(self):
         toggle = self._on_air_toggle
         if toggle:
-            start = toggle.get('startTime').split('+')
-            end   = toggle.get('endTime').split('+')
-            td    = timedelta(hours=int(start[1][:2]))
             try:
-                start = strptime(start[0], '%Y-%m-%dT%H:%M:%S') - td
-                end   = strptime(end[0],   '%Y-%m-%dT%H:%M:%S') - td
-                return start, end
-            except (ValueError, TypeError) as e:
+                return clock.utc_span(toggle.get('startTime'), toggle.get('endTime'))
+            except (ValueError, TypeError):
                 pass
         return None, None
 
@@ -1786,13 +2548,13 @@ class PlayableResource(Resource):
     def path(self):
         return
 
-    @property
+    @memoised
     def title(self):
         if self._data:
             return self._data.get('title')
         else:
             start, end = self._on_air_status
-            localtime = datetime.utcnow()
+            localtime = clock.now()
             title = None
 
             if start and end and self._on_air_toggle:
@@ -1819,7 +2581,7 @@ class PlayableResource(Resource):
     def _itemtime(self):
         if self.subtitle:
             try:
-                return time.strptime(self.subtitle, '%d %B %Y')
+                return clock.struct_time(self.subtitle, '%d %B %Y')
             except ValueError:
                 return
 
@@ -1852,7 +2614,7 @@ class PlayableResource(Resource):
             return self._audio_data.get('path')
         else:
             start, end = self._on_air_status
-            localtime = datetime.utcnow()
+            localtime = clock.now()
 
             if start and end:
                 if start < localtime and end > localtime:
@@ -1909,6 +2671,7 @@ class ProgramBroadcast(PlayableResource):
           ]
         }"
     '''
+    __slots__ = ()
 
 
 
@@ -1939,10 +2702,12 @@ class ProgramBroadcastSegment(PlayableResource):
         }
       '><div class="d-flex">
     '''
+    __slots__ = ()
 
 
 
 class ProgramBroadcastTrack(Resource, ExternalMedia):
+    __slots__ = ('__artist', '__title', '__href')
     _media = {}
 
     def id(self):
@@ -1958,7 +2723,7 @@ class ProgramBroadcastTrack(Resource, ExternalMedia):
         else:
             return super().type
 
-    @property
+    @memoised
     def artist(self):
         return self._itemobj.find(class_='audio-summary__track-artist').text.strip()
 
@@ -1972,13 +2737,25 @@ class ProgramBroadcastTrack(Resource, ExternalMedia):
         params = { 'q': f'{self.title} - {self.artist}' }
         return '/tracks/search?' + urlencode(params)
 
-    @property
+    @memoised
     def title(self):
         return self._itemobj.find(class_='audio-summary__track-title').text.strip()
 
+    @memoised
+    def href(self):
+        return self._itemobj.find(class_='audio-summary__track-title').attrs.get('href')
+
+    @classmethod
+    def resolve_media(cls, tracks):
+        linked = [track for track in tracks if track.href]
+        if linked:
+            media_items = linked[0].media_items([{'src': track.href} for track in linked], fetch_album_art=True)
+            for track, media in zip(linked, media_items):
+                track._media = media
+
     def _get_media(self):
         if not self._media:
-            href = self._itemobj.find(class_='audio-summary__track-title').attrs.get('href')
+            href = self.href
             if href:
                 self._media = self.media_items([{'src': href}], fetch_album_art=True)[0]
         return self._media if self._media else {}
@@ -2020,6 +2797,8 @@ class ProgramBroadcastTrack(Resource, ExternalMedia):
 
 
 class BroadcastCollection(Resource):
+    __slots__ = ('___data', '__title')
+
     @property
     def type(self):
         return 'broadcast_index'
@@ -2035,7 +2814,7 @@ class BroadcastCollection(Resource):
         else:
             return {}
 
-    @property
+    @memoised
     def _data(self):
         return self._playable.get('data', {})
 
@@ -2044,7 +2823,7 @@ class BroadcastCollection(Resource):
         if self._data:
             return round(self._data.get('duration'))
 
-    @property
+    @memoised
     def title(self):
         return self._itemobj.find(class_='card__title').text
 
@@ -2077,6 +2856,7 @@ class BroadcastCollection(Resource):
 
 
 class AudioItem:
+    __slots__ = ('_itemobj', '_itemdata', '_href', 'textbody')
 
     @classmethod
     def factory(cls, item):
@@ -2092,41 +2872,45 @@ class AudioItem:
 
         view_playable_div = item.find(lambda tag:tag.name == 'div' and 'data-view-playable' in tag.attrs)
         if view_playable_div:
-            view_playable = view_playable_div.attrs['data-view-playable']
-            itemobj = json.loads(view_playable)['items'][0]
-
-            if 'data-view-account-toggle' in view_playable_div.parent.parent.attrs:
-                itemobj['subscription_required'] = True
-            else:
-                itemobj['subscription_required'] = False
-
-            if   itemobj['type'] == 'clip':
-                obj = Segment(item, itemobj, textbody)
-            elif itemobj['type'] == 'broadcast_episode':
-                obj = Broadcast(item, itemobj, textbody)
-            elif itemobj['type'] == 'audio_archive_item':
-                obj = Archive(item, itemobj, textbody)
-            elif itemobj['type'] == 'podcast_episode':
-                obj = Podcast(item, itemobj, textbody)
-            else:
-                obj = AudioItem(item, itemobj, textbody)
-            return obj.to_dict()
+            card_anchor = item.find(class_='card__anchor')
+            return cls.from_playable(
+                view_playable_div.attrs['data-view-playable'],
+                'data-view-account-toggle' in view_playable_div.parent.parent.attrs,
+                textbody,
+                card_anchor.attrs['href'] if card_anchor else None,
+            )
         else:
             # Should we _also_ have a NonPlayable AudioItem ?
             return None
 
+    @classmethod
+    def from_playable(cls, view_playable, subscription_required, textbody, href):
+        itemobj = json.loads(view_playable)['items'][0]
+        itemobj['subscription_required'] = subscription_required
+
+        if   itemobj['type'] == 'clip':
+            obj = Segment(itemobj, textbody, href)
+        elif itemobj['type'] == 'broadcast_episode':
+            obj = Broadcast(itemobj, textbody, href)
+        elif itemobj['type'] == 'audio_archive_item':
+            obj = Archive(itemobj, textbody, href)
+        elif itemobj['type'] == 'podcast_episode':
+            obj = Podcast(itemobj, textbody, href)
+        else:
+            obj = AudioItem(itemobj, textbody, href)
+        return obj
+
 
-    def __init__(self, item, itemobj, textbody):
-        self._item = item
+    def __init__(self, itemobj, textbody, href=None):
         self._itemobj = itemobj
         self._itemdata = itemobj['data']
+        self._href = href
         self.textbody = textbody
 
     @property
     def resource_path(self):
-        card_anchor = self._item.find(class_='card__anchor')
-        if card_anchor:
-            return Scraper.resource_path_for(card_anchor.attrs['href'])
+        if self._href is not None:
+            return Scraper.resource_path_for(self._href)
 
     @property
     def type(self):
@@ -2150,7 +2934,7 @@ class AudioItem:
 
     @property
     def _itemtime(self):
-        return time.strptime(self._itemdata['subtitle'], '%d %B %Y')
+        return clock.struct_time(self._itemdata['subtitle'], '%d %B %Y')
 
     @property
     def date(self):
@@ -2189,41 +2973,42 @@ class AudioItem:
             l = self.duration
             return 'https://ondemand.rrr.org.au/getclip?bw=h&l={}&m=r&p=1&s={}'.format(l, ts)
 
-    def to_dict(self):
-        item = {
-            'type':          self.type,
-            'id':            self.id,
-            'attributes': {
-                'title':         self.title,
-                'subtitle':      self.subtitle,
-                'textbody':      self.textbody,
-                'date':          self.date,
-                'year':          self.year,
-                'aired':         self.aired,
-                'duration':      self.duration,
-                'url':           self.url,
-                'thumbnail':     self.thumbnail,
-            },
-            'links': {
+    def to_item(self):
+        item = Item(
+            type      = self.type,
+            id        = self.id,
+            title     = self.title,
+            subtitle  = self.subtitle,
+            textbody  = self.textbody,
+            date      = self.date,
+            year      = self.year,
+            aired     = self.aired,
+            duration  = self.duration,
+            url       = self.url,
+            thumbnail = self.thumbnail,
+            links     = {
                 'self': self.resource_path,
             }
-        }
+        )
         if self.subscription_required:
-            item['links']['subscribe'] = '/subscribe'
+            item.links['subscribe'] = '/subscribe'
         return item
 
+    def to_dict(self):
+        return self.to_item().to_dict()
+
 
 class Archive(AudioItem):
-    ''
+    __slots__ = ()
 
 class Broadcast(AudioItem):
-    ''
+    __slots__ = ()
 
 class Segment(AudioItem):
-    ''
+    __slots__ = ()
 
 class Podcast(AudioItem):
-    ''
+    __slots__ = ()
 
 
 if __name__ == "__main__":
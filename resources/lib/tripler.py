@@ -1,13 +1,16 @@
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import time, sys, os, json, re
-import pytz
 from xbmcaddon import Addon
 import xbmcgui
 import xbmcplugin
+import xbmcvfs
 import xbmc
 
-from resources.lib.scraper import Scraper
+import resources.lib.scraper as scraper
+from resources.lib.scraper import Scraper, ExternalMedia
+from resources.lib.cache   import HTTPCache, MediaCache, ResultCache
+from resources.lib         import client, clock, engine
 from resources.lib.website import TripleRWebsite
 from resources.lib.media   import Media
 
@@ -19,10 +22,11 @@ class TripleR():
         self.handle     = int(sys.argv[1])
         self.id         = 'plugin.audio.tripler'
         self.url        = 'plugin://' + self.id
-        self.tz         = pytz.timezone('Australia/Melbourne')
+        self.tz         = clock.melbourne
         self.addon      = Addon()
         self.dialog     = xbmcgui.Dialog()
         self._respath   = os.path.join(self.addon.getAddonInfo('path'), 'resources')
+        self._profile   = xbmcvfs.translatePath(self.addon.getAddonInfo('profile'))
         self.icon       = os.path.join(self._respath, 'icon.png')
         self.fanart     = os.path.join(self._respath, 'fanart.png')
         self.website    = TripleRWebsite(os.path.join(self._respath, 'cookies.lwp'))
@@ -32,6 +36,13 @@ class TripleR():
         self.quality    = int(quality) if quality else 1
         self.media      = Media(self.quality)
 
+        scraper.http_cache = HTTPCache(os.path.join(self._profile, 'http'))
+        version         = self.addon.getAddonInfo('version')
+        scraper.result_cache = ResultCache(os.path.join(self._profile, 'results'), version)
+        scraper.media_cache = MediaCache(os.path.join(self._profile, 'media'), version)
+        media_workers   = self.addon.getSetting('media_workers')
+        engine.instance.concurrency = int(media_workers) if media_workers else 8
+
         self.nextpage   = self.get_string(30004)
         self.lastpage   = self.get_string(30005)
 
@@ -97,11 +108,21 @@ class TripleR():
             self.play_stream(handle=self.handle, args=args, segments=segments)
             return None
         else:
-            scraped = Scraper.call(path)
-            parsed = self.parse_programs(**scraped, args=args, segments=segments, k_title=k_title)
+            listing = Scraper.items(path)
+            parsed = self.parse_programs(listing, args=args, segments=segments, k_title=k_title)
             if parsed:
                 return parsed
 
+    def shutdown(self):
+        ExternalMedia.shutdown()
+        client.instance.close()
+        for (plugin, strategy), cost in ExternalMedia.costs.items():
+            xbmc.log(
+                f"TripleR media lookup {plugin}/{strategy}: {cost['requests']} requests, "
+                f"{cost['bytes']} bytes, {cost['seconds']:.2f}s, {cost['filled']} fields filled",
+                xbmc.LOGDEBUG
+            )
+
     def main_menu(self):
         items = [
             self.livestream_item(),
@@ -187,8 +208,8 @@ class TripleR():
 
         if picked_date_str:
             date_str    = '-'.join([i.zfill(2) for i in picked_date_str.replace(' ', '').split('/')[::-1]])
-            current     = datetime(*(time.strptime(date_str, '%Y-%m-%d')[0:6]), tzinfo=self.tz)
-            daydelta    = datetime.now(self.tz) - current - timedelta(hours=6)
+            current     = clock.strptime(date_str, '%Y-%m-%d').replace(tzinfo=self.tz)
+            daydelta    = clock.local_now() - current - timedelta(hours=6)
             if daydelta.days != 0:
                 return date_str
 
@@ -223,35 +244,31 @@ class TripleR():
             )
         xbmcplugin.setResolvedUrl(self.handle, True, li)
 
-    def parse_programs(self, data, args, segments, links=None, k_title=None):
+    def parse_programs(self, listing, args, segments, k_title=None):
         items = []
+        today = time.strftime('%d.%m.%Y', time.localtime())
 
-        for menuitem in data:
-            if menuitem is None:
-                continue
-            m_id, m_type = menuitem.get('id', ''), menuitem.get('type', '')
-            m_links      = menuitem.get('links', {})
+        for item in listing:
+            m_id, m_type = item.id or '', item.type or ''
+            m_links      = item.links or {}
             m_self       = m_links.get('self', '/')
             m_sub        = m_links.get('subscribe')
             m_playlist   = m_links.get('playlist')
-            attributes   = menuitem.get('attributes', {})
-            if attributes is None:
-                continue
 
-            textbody        = attributes.get('textbody', '')
-            thumbnail       = attributes.get('thumbnail', '')
-            fanart          = attributes.get('background', self.fanart)
+            textbody        = item.textbody or ''
+            thumbnail       = item.thumbnail or ''
+            fanart          = item.background or self.fanart
             pathurl         = None
 
-            if attributes.get('subtitle') and not ('soundscapes' in segments and len(segments) > 1):
-                textbody    = '\n'.join((self.get_string(30007) % (attributes.get('subtitle')), textbody))
+            if item.subtitle and not ('soundscapes' in segments and len(segments) > 1):
+                textbody    = '\n'.join((self.get_string(30007) % (item.subtitle), textbody))
 
-            if attributes.get('venue'):
-                textbody    = '\n'.join((attributes['venue'], textbody))
+            if item.venue:
+                textbody    = '\n'.join((item.venue, textbody))
 
             if m_type in self.supported_plugins:
-                title       = attributes.get('title', '')
-                artist      = attributes.get('artist')
+                title       = item.title or ''
+                artist      = item.artist
                 if artist:
                     title   = f'{artist} - {title}'
                 pathurl     = self.media.parse_media_id(m_type, m_id, quote_plus(title.split('(')[0].strip()))
@@ -273,9 +290,9 @@ class TripleR():
                 else:
                     is_playable = False
             else:
-                title       = attributes.get('title', '')
-                artist      = attributes.get('artist')
-                pathurl     = attributes.get('url')
+                title       = item.title or ''
+                artist      = item.artist
+                pathurl     = item.url
                 if artist:
                     title   = f'{artist} - {title}'
                 if m_type == 'broadcast' and pathurl:
@@ -284,7 +301,7 @@ class TripleR():
                     title   = f'{title} ({self.get_string(30049)})'
                 if m_type == 'segment':
                     title   = f'{title} ({self.get_string(30051)})'
-                on_air = attributes.get('on_air')
+                on_air = item.on_air
                 if on_air:
                     title   = f'{title} ({on_air})'
                 is_playable = True
@@ -293,7 +310,7 @@ class TripleR():
                 title   = f'{title} ({self.get_string(30052)})'
                 thumbnail   = 'DefaultMusicSongs.png'
                 ext_search  = m_links.get('broadcast_track').replace('search', 'ext_search')
-                pathurl     = self._k_title(self.url + ext_search, attributes.get('title'))
+                pathurl     = self._k_title(self.url + ext_search, item.title)
                 is_playable = False
 
             icon = thumbnail
@@ -312,18 +329,18 @@ class TripleR():
                 title      += ' ({})'.format(self.get_string(30069))
                 textbody    = '\n'.join((self.get_string(30070), textbody))
 
-            if attributes.get('start') and attributes.get('end'):
-                datestart   = datetime.fromisoformat(attributes['start'])
-                dateend     = datetime.fromisoformat(attributes['end'])
+            if item.start and item.end:
+                datestart   = datetime.fromisoformat(item.start)
+                dateend     = datetime.fromisoformat(item.end)
                 start       = datetime.strftime(datestart, '%H:%M')
                 end         = datetime.strftime(dateend,   '%H:%M')
                 textbody    = f'{start} - {end}\n{textbody}'
                 title       = ' - '.join((start, end, title))
 
-            if attributes.get('aired'):
-                aired       = self.get_string(30006) % (attributes['aired'])
+            if item.aired:
+                aired       = self.get_string(30006) % (item.aired)
             else:
-                aired       = attributes.get('date', '')
+                aired       = item.date or ''
 
             if pathurl:
                 is_playable = not pathurl.startswith('plugin://')
@@ -340,18 +357,18 @@ class TripleR():
                 mediatype = 'song'
                 info_type = 'video'
             else:
-                pathurl     = self._k_title(self.url + m_self, attributes.get('title'))
+                pathurl     = self._k_title(self.url + m_self, item.title)
                 is_playable = False
                 mediatype   = ''
                 info_type   = 'video'
 
-            date, year = attributes.get('date', ''), attributes.get('year', '')
+            date, year = item.date or '', item.year or ''
             if date:
-                date = time.strftime('%d.%m.%Y', time.strptime(date, '%Y-%m-%d'))
+                date = clock.reformat(date, '%Y-%m-%d', '%d.%m.%Y')
                 year = date[0]
             else:
                 # prevents log entries regarding empty date string
-                date = time.strftime('%d.%m.%Y', time.localtime())
+                date = today
 
 
             li = xbmcgui.ListItem(title, aired, pathurl, True)
@@ -392,8 +409,8 @@ class TripleR():
                     vi.setYear(int(year))
                 vi.setFirstAired(aired)
                 vi.setPremiered(aired)
-                if attributes.get('duration', 0) > 0:
-                    vi.setDuration(attributes.get('duration'))
+                if (item.duration or 0) > 0:
+                    vi.setDuration(item.duration)
                 if mediatype:
                     vi.setMediaType(mediatype)
             else: # Matrix v19.0
@@ -406,8 +423,8 @@ class TripleR():
                     'aired':     aired,
                 }
 
-                if attributes.get('duration', 0) > 0:
-                    vi['duration'] = attributes.get('duration')
+                if (item.duration or 0) > 0:
+                    vi['duration'] = item.duration
                 if mediatype:
                     vi['mediatype'] = mediatype
 
@@ -415,6 +432,8 @@ class TripleR():
 
             items.append((pathurl, li, not is_playable))
 
+        # pagination is only known once the whole listing has been read
+        links = listing.links
 
         if 'schedule' in segments:
             self_date = links.get('self', '?date=').split('?date=')[-1]
@@ -1,6 +1,6 @@
 from resources.lib.scraper import USER_AGENT
+from resources.lib import client
 
-from urllib.request import Request, build_opener, HTTPCookieProcessor
 from urllib.parse import urlencode
 from urllib.error import HTTPError
 
@@ -27,23 +27,14 @@ class TripleRWebsite():
             pass
 
     def request(self, url, data=None):
-        if data:
-            req = Request(url, data.encode())
-        else:
-            req = Request(url)
-        req.add_header('User-Agent', USER_AGENT)
-
-        opener = build_opener(HTTPCookieProcessor(self.cj))
+        data = data.encode() if data else None
 
         try:
-            response = opener.open(req)
+            response = client.instance.request(url, data, headers={'User-Agent': USER_AGENT}, cookiejar=self.cj)
         except HTTPError as e:
             return e
 
-        source = response.read().decode()
-        response.close()
-
-        return source
+        return response.read().decode()
 
     def login(self, emailaddress, password):
         if password is None and self._loadcj():
@@ -0,0 +1,168 @@
+import os, re
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from resources.lib import scraper
+
+PAGES     = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pages')
+# hand-made pages, for layouts the recorded ones don't have
+SYNTHETIC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'synthetic')
+
+# resource paths whose pages are all under tests/pages
+ROUTES = [
+    '/segments', '/archives', '/programs', '/featured_albums', '/news_items', '/soundscapes', '/giveaways', '/events',
+    '/topics', '/search?q=x', '/topics/t1', '/tracks/search?q=x', '/schedule', '/programs/prog-1',
+    '/programs/prog-1/broadcasts', '/programs/prog-1/broadcasts/12', '/giveaways/g-1', '/featured_albums/album-1',
+    '/events/e-1', '/archives/arc-1',
+]
+
+# list routes read by AudioItemGenerator
+CARD_ROUTES = ['/segments', '/archives']
+
+
+def page(url):
+    '''
+    Markup of the recorded page for a website url, one file per path.
+    '''
+    name = urlsplit(url).path.strip('/').replace('/', '__') or 'index'
+    with open(os.path.join(PAGES, name + '.html'), 'rb') as f:
+        return f.read()
+
+def synthetic(name):
+    with open(os.path.join(SYNTHETIC, name + '.html'), 'rb') as f:
+        return f.read()
+
+@contextmanager
+def recorded(parser=None):
+    '''
+    Serves the scrapers' fetches from tests/pages, without the result
+    cache, and optionally with another html_parser.
+    '''
+    saved = scraper.get_cached, scraper.html_parser, scraper.result_cache
+    scraper.get_cached = page
+    scraper.result_cache = None
+    if parser:
+        scraper.html_parser = parser
+    try:
+        yield
+    finally:
+        scraper.get_cached, scraper.html_parser, scraper.result_cache = saved
+
+
+E = scraper.ExternalMedia
+
+# the fields each provider page is scanned for, as (first, every), with
+# markup that each pattern matches
+PROVIDER_SCANS = {
+    'bandcamp_track': (
+        {'art': E.RE_BANDCAMP_TRACK_ART, 'band': E.RE_BANDCAMP_TRACK_BAND_ART, 'title': E.RE_BANDCAMP_TRACK_TITLE,
+         'artist': E.RE_BANDCAMP_TRACK_ARTIST, 'data': E.RE_BANDCAMP_TRACK_DATA},
+        {'duration': E.RE_BANDCAMP_TRACK_DURATION},
+    ),
+    'youtube_video': (
+        {'duration': E.RE_YOUTUBE_VIDEO_DURATION, 'title': E.RE_YOUTUBE_VIDEO_TITLE,
+         'artist': E.RE_YOUTUBE_VIDEO_ARTIST, 'textbody': E.RE_YOUTUBE_VIDEO_DESC},
+        {},
+    ),
+    'youtube_playlist': (
+        {'art': E.RE_YOUTUBE_PLAYLIST_ART, 'art_lq': E.RE_YOUTUBE_PLAYLIST_ART_LQ,
+         'title': E.RE_YOUTUBE_PLAYLIST_TITLE, 'artist': E.RE_YOUTUBE_PLAYLIST_ARTIST},
+        {'duration': E.RE_YOUTUBE_PLAYLIST_DURATION},
+    ),
+    'spotify_album': (
+        {'art': E.RE_SPOTIFY_ALBUM_ART},
+        {'duration': E.RE_SPOTIFY_DURATION},
+    ),
+    'apple_album': (
+        {'art': E.RE_APPLE_ALBUM_ART},
+        {'duration': E.RE_APPLE_DURATION},
+    ),
+}
+
+PROVIDER_MARKUP = {
+    'bandcamp_track': [
+        'art_id&quot;:{n},',
+        '<div data-band="{{&quot;id&quot;:{n},&quot;name&quot;:&quot;Band {n}&quot;,&quot;image_id&quot;:{n}}}"></div>',
+        '<h2 class="trackTitle">\n    Track {n}\n    </h2>',
+        '<div data-tralbum="{{&quot;duration&quot;:{n}.5,&quot;x&quot;:1,&quot;duration&quot;:2{n}.25,}}"></div>',
+        'duration&quot;:{n}.75,',
+    ],
+    'youtube_video': [
+        '<meta itemprop="duration" content="PT{n}M{n}S">',
+        '"videoDetails":{{"videoId":"v{n}","title":"Video {n}"}}',
+        '<link itemprop="name" content="Channel {n}">',
+        '"attributedDescription":{{"content":"About video {n}","styleRuns":[]}}',
+    ],
+    'youtube_playlist': [
+        '<meta property="og:image" content="https://i.ytimg.com/{n}.jpg?s=1&amp;b=2"><meta property="og:image:width" content="640">',
+        '<meta property="og:image" content="https://i.ytimg.com/lq{n}.jpg?s=1">',
+        '<meta property="og:title" content="Playlist {n}">',
+        '"shortBylineText":{{"runs":[{{"text":"Channel {n}"',
+        '"lengthText":{{"accessibility":{{"label":"{n} minutes"}}}},"simpleText":"{n}:0{n}"}}',
+    ],
+    'spotify_album': [
+        '<div style="--image-src:url(&#x27;https://i.scdn.co/image/{n}&#x27;)"></div>',
+        '<h4>Song {n}</h4><div class="dur">{n}:0{n}</div></li>',
+    ],
+    'apple_album': [
+        '<meta name="twitter:image" content="https://is1.mzstatic.com/{n}.jpg">',
+        '<meta property="music:song:duration" content="PT{n}M{n}S">',
+    ],
+}
+
+FILLER = (
+    '<div class="row"><span data-x="{n}">text {n} &amp; more</span>'
+    '<script>var o = {{"k{n}": [1, 2, "v"], "u": "https://example.com/{n}"}};</script></div>\n'
+)
+
+
+def provider_page(rnd, provider, size):
+    '''
+    A page of about `size` characters of unrelated markup, with the
+    provider's fields dropped in at random places.
+    '''
+    parts, length = [], 0
+    while length < size:
+        if rnd.random() < 0.02:
+            part = rnd.choice(PROVIDER_MARKUP[provider]).format(n=rnd.randint(1, 9))
+        else:
+            part = FILLER.format(n=rnd.randint(0, 10 ** 6))
+        parts.append(part)
+        length += len(part)
+    return ''.join(parts)
+
+
+def recorded_provider_page(provider):
+    '''
+    The recorded pages back to back, about the size of a provider page,
+    with one of each of the provider's fields in the head of every page.
+    '''
+    fields = ''.join(markup.format(n=n) for n, markup in enumerate(PROVIDER_MARKUP[provider], 1))
+    pages = []
+    for name in sorted(os.listdir(PAGES)):
+        with open(os.path.join(PAGES, name), encoding='utf-8') as f:
+            pages.append(f.read().replace('</head>', fields + '</head>', 1))
+    return ''.join(pages)
+
+def route_paths(attribute):
+    '''
+    Paths for every scraper's pattern, with and without a query string,
+    filled with values that also fit the fixed parts of other patterns,
+    and some paths that no pattern matches.
+    '''
+    paths = ['', '/nope', '/programs//broadcasts', '/explore/programs/a/b/c/d', '/segments/', '//']
+    for scraper_class in scraper.Scraper.__subclasses__():
+        pattern = getattr(scraper_class, attribute)
+        for value in ('p-1', 'search', 'episodes', 'a.b'):
+            path = re.sub('{[A-z]+}', value, pattern)
+            paths += [path, path + '?page=2', path + '?q=a&b=c', path + '/x']
+    return paths
+
+def linear_route(attribute, path):
+    '''
+    Routes a path by trying each scraper in turn, as before RouteIndex.
+    '''
+    for scraper_class in scraper.Scraper.__subclasses__():
+        m = scraper_class.regex_from(getattr(scraper_class, attribute)).match(path)
+        if m:
+            return scraper_class, m.groupdict()
@@ -0,0 +1,55 @@
+import tempfile, unittest
+from datetime import datetime
+from unittest import mock
+
+from resources.lib import clock
+from resources.lib.cache import NO_EXPIRY, ResultCache
+from resources.lib.scraper import Scraper
+
+
+class ResultCacheTest(unittest.TestCase):
+    '''
+    Results on disk are read back by the addon version that kept them only.
+    '''
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_version(self):
+        ResultCache(self.tmp.name, '3.0.0').set('/schedule?date=2020-05-01', {'data': [1]}, float('inf'))
+        self.assertEqual(ResultCache(self.tmp.name, '3.0.0').get('/schedule?date=2020-05-01'), {'data': [1]})
+        self.assertIsNone(ResultCache(self.tmp.name, '3.0.1').get('/schedule?date=2020-05-01'))
+
+    def test_expiry(self):
+        cache = ResultCache(self.tmp.name)
+        cache.set('/segments', {'data': [1]}, -1)
+        self.assertIsNone(cache.get('/segments'))
+        self.assertIsNone(ResultCache(self.tmp.name).get('/segments'))
+
+
+
+class ScheduleMaxAgeTest(unittest.TestCase):
+    '''
+    A day's schedule is kept for good only once its broadcast day, which
+    runs until 6am, is over.
+    '''
+
+    def max_age(self, date, now):
+        with mock.patch.object(clock, 'local_now', return_value=now):
+            return Scraper.find_by_resource_path(f'/schedule?date={date}').max_age()
+
+    def test_before_6am(self):
+        now = datetime(2022, 10, 20, 3, 0, tzinfo=clock.melbourne)
+        self.assertEqual(self.max_age('2022-10-19', now), 0)
+        self.assertEqual(self.max_age('2022-10-20', now), 0)
+        self.assertEqual(self.max_age('2022-10-18', now), NO_EXPIRY)
+
+    def test_after_6am(self):
+        now = datetime(2022, 10, 20, 6, 0, tzinfo=clock.melbourne)
+        self.assertEqual(self.max_age('2022-10-19', now), NO_EXPIRY)
+        self.assertEqual(self.max_age('2022-10-20', now), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
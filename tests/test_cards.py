@@ -0,0 +1,108 @@
+import json, random, unittest
+from html import escape
+from unittest import mock
+
+from resources.lib import clock, scraper
+from resources.lib.scraper import AudioItem, AudioItemGenerator, CardScanner, Scraper, prune
+from tests import fixtures
+
+
+def playable(source_id):
+    data = {'title': f'Title {source_id}', 'subtitle': '1 October 2022', 'timestamp': '20221019000000', 'duration': 60}
+    return escape(json.dumps({'items': [{'type': 'clip', 'source_id': source_id, 'data': data}]}))
+
+# cards whose playable sits right inside .card__text, so the account toggle
+# is read from the enclosing card
+TOGGLED_CARDS = (
+    b'<html><body><main>'
+    b'<div class="card" data-view-account-toggle><div class="card__text"><h3>T0</h3>'
+    b'<div data-view-playable="%s"></div></div></div>'
+    b'<div class="card"><div class="card__text"><h3>T1</h3>'
+    b'<div data-view-playable="%s"></div></div></div>'
+    b'</main></body></html>'
+) % (playable(0).encode(), playable(1).encode())
+
+TOGGLE = ' data-view-account-toggle'
+
+def card(rnd, source_id):
+    '''
+    A card with the playable at a random depth, each wrapper possibly an
+    account toggle, and some void elements and card text around it.
+    '''
+    player = f'<div data-view-playable="{playable(source_id)}"><button>Play</button></div>'
+    for _ in range(rnd.randint(0, 3)):
+        before = rnd.choice(['', '', '', '<br>', '<img src="a.jpg">', '<source src="a.mp3">', '<source src="b"/>', '<hr>'])
+        name = rnd.choice(['div', 'span', 'section'])
+        player = f'<{name}{rnd.choice(["", TOGGLE])}>{before}{player}</{name}>'
+    body = rnd.choice([
+        '',
+        f'<div class="card__body"><p>Body {source_id} &amp; co</p><p>more</p></div>',
+        f'<div class="card__body"><p>Body {source_id}</p><source src="c.mp3"><p>more</p></div>',
+        f'<span class="card__meta">Meta {source_id}</span>',
+    ])
+    anchor = rnd.choice(['', f'<a class="card__anchor" href="/on-demand/segments/s-{source_id}"><img src="x"></a>'])
+    return f'<div class="card"{rnd.choice(["", TOGGLE])}><div class="card__text">{anchor}<h3>T{source_id}</h3>{body}{player}</div></div>'
+
+def as_dicts(items):
+    return [item.to_item().to_dict() if item else None for item in items]
+
+
+class CardsTest(unittest.TestCase):
+    '''
+    Cards read by the CardScanner or from a strained tree match those read
+    from the whole page.
+    '''
+
+    def call(self, markup, parse_only, scan=False):
+        with fixtures.recorded(), clock.snapshot():
+            with mock.patch.object(scraper, 'get_cached', return_value=markup), \
+                 mock.patch.object(AudioItemGenerator, 'PARSE_ONLY', parse_only):
+                if scan:
+                    return Scraper.call('/segments')
+                with mock.patch.object(CardScanner, 'scan', return_value=None):
+                    return Scraper.call('/segments')
+
+    def test_toggle_outside_strained_card(self):
+        result = self.call(TOGGLED_CARDS, AudioItemGenerator.PARSE_ONLY)
+        self.assertEqual(result, self.call(TOGGLED_CARDS, None))
+        subscribe = [bool(item.get('links', {}).get('subscribe')) for item in result['data']]
+        self.assertEqual(subscribe, [True, False])
+
+    def test_generated_cards(self):
+        rnd = random.Random(17)
+        parsers = ['html.parser']
+        if scraper.bs4.builder.builder_registry.lookup('lxml'):
+            parsers.append('lxml')
+        with clock.snapshot():
+            for n in range(500):
+                markup = prune(('<html><body><main>%s</main></body></html>' % '\n'.join(
+                    card(rnd, source_id) for source_id in range(rnd.randint(1, 4))
+                )).encode())
+                cards = CardScanner().scan(markup)
+                if cards is None:
+                    continue
+                scanned = as_dicts(AudioItem.from_playable(**found) if found else None for found in cards)
+                for parser in parsers:
+                    soup = scraper.bs4.BeautifulSoup(markup, parser)
+                    with self.subTest(n=n, parser=parser):
+                        self.assertEqual(scanned, as_dicts(AudioItem.factory(div) for div in soup.findAll(class_='card__text')))
+
+    def test_recorded_pages(self):
+        for route in fixtures.CARD_ROUTES:
+            url = Scraper.find_by_resource_path(route).url()
+            with self.subTest(route=route):
+                markup = fixtures.page(url)
+                expected = self.call(markup, None)
+                self.assertEqual(self.call(markup, AudioItemGenerator.PARSE_ONLY), expected)
+                # a player right inside .card__text leaves the page to bs4
+                self.assertIsNone(CardScanner().scan(scraper.prune(markup)))
+                self.assertEqual(self.call(markup, AudioItemGenerator.PARSE_ONLY, scan=True), expected)
+
+    def test_nested_cards(self):
+        markup = fixtures.synthetic('nested-cards')
+        self.assertIsNotNone(CardScanner().scan(scraper.prune(markup)))
+        self.assertEqual(self.call(markup, AudioItemGenerator.PARSE_ONLY, scan=True), self.call(markup, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from resources.lib.scraper import Item, memoised
+
+
+class ItemTest(unittest.TestCase):
+    '''
+    to_dict() keeps attributes in the order the item was built with, so
+    that call() prints the same JSON as the dicts it replaced.
+    '''
+
+    def test_keyword_order(self):
+        item = Item(type='event', id='e-1', title='T', thumbnail='t.jpg', venue='V', textbody='B')
+        self.assertEqual(list(item.to_dict()['attributes']), ['title', 'thumbnail', 'venue', 'textbody'])
+
+    def test_extra_attributes(self):
+        attributes = {'title': 'T', 'link': 'l', 'textbody': 'B', 'count': None, 'thumbnail': 't.jpg'}
+        item = Item.from_attributes('collection', 'c-1', attributes)
+        self.assertEqual(item.to_dict()['attributes'], attributes)
+        self.assertEqual(list(item.to_dict()['attributes']), list(attributes))
+        self.assertEqual(item.extra, {'link': 'l', 'count': None})
+
+    def test_fields_set_later(self):
+        item = Item(type='program', id='p-1', title='T')
+        item.thumbnail = 't.jpg'
+        self.assertEqual(item.to_dict()['attributes'], {'title': 'T', 'thumbnail': 't.jpg'})
+
+
+class Base:
+    __slots__ = ('calls', '__name')
+
+    def __init__(self):
+        self.calls = []
+
+    @memoised
+    def name(self):
+        self.calls.append('base')
+        return 'base'
+
+
+class Derived(Base):
+    __slots__ = ('__name',)
+
+    @memoised
+    def name(self):
+        self.calls.append('derived')
+        return 'derived ' + super().name
+
+
+class MemoisedTest(unittest.TestCase):
+    '''
+    memoised keeps each value in a slot of the class that defines the
+    property, so the models carry no per-instance dict.
+    '''
+
+    def test_computed_once(self):
+        obj = Derived()
+        self.assertEqual([obj.name, obj.name], ['derived base', 'derived base'])
+        self.assertEqual(obj.calls, ['derived', 'base'])
+        self.assertEqual(Base.name.__get__(obj), 'base')
+        self.assertEqual(obj.calls, ['derived', 'base'])
+        self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_missing_slot(self):
+        with self.assertRaises((TypeError, RuntimeError)):
+            class Unslotted:
+                __slots__ = ()
+
+                @memoised
+                def name(self):
+                    return 'name'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import random, unittest
+
+from resources.lib.scraper import normalise
+
+
+# the passes call() made over a result before normalise()
+def strip_value(v):
+    if  isinstance(v, dict):
+        return strip_values(v)
+    elif isinstance(v, list):
+        return [strip_values(x) for x in v]
+    elif isinstance(v, str):
+        return v.strip()
+    else:
+        return v
+
+def strip_values(d):
+    if isinstance(d, dict):
+        return { k: remove_nulls(strip_value(v)) for k, v in d.items() }
+    else:
+        return d
+
+def remove_nulls(obj):
+    if  isinstance(obj, dict):
+        return { k: remove_nulls(v) for k, v in obj.items() if v }
+    elif isinstance(obj, list):
+        return [remove_nulls(x) for x in obj if x]
+    else:
+        return obj
+
+
+SCALARS = [None, '', ' ', '  x ', 'y', '\n', 0, 1, 0.0, 2.5, False, True, (), (0,), b'', b' a ']
+
+def structure(rnd, depth):
+    r = rnd.random()
+    if depth <= 0 or r < 0.35:
+        return rnd.choice(SCALARS)
+    if r < 0.7:
+        return {rnd.choice('abcdefg'): structure(rnd, depth - 1) for _ in range(rnd.randint(0, 4))}
+    return [structure(rnd, depth - 1) for _ in range(rnd.randint(0, 4))]
+
+
+class NormaliseTest(unittest.TestCase):
+    '''
+    normalise() gives what strip_values() did, down to key order and types.
+    '''
+
+    def test_structures(self):
+        rnd = random.Random(21)
+        for _ in range(20000):
+            obj = structure(rnd, rnd.randint(0, 7))
+            # repr, so that 0 and False or 0.0 and 0 don't compare equal
+            self.assertEqual(repr(normalise(obj)), repr(strip_values(obj)), obj)
+
+    def test_does_not_modify(self):
+        obj = {'data': [{'a': ' x ', 'b': [{}, {'c': ''}]}], 'links': {}}
+        expected = repr(obj)
+        normalise(obj)
+        self.assertEqual(repr(obj), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
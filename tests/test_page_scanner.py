@@ -0,0 +1,65 @@
+import random, unittest
+
+from resources.lib.scraper import PageScanner
+from tests import fixtures
+
+
+def searched(page, first, every):
+    # one search or finditer per field over the whole page
+    return (
+        {name: (pattern.search(page).groupdict() if pattern.search(page) else None) for name, pattern in first.items()},
+        {name: [match.groupdict() for match in pattern.finditer(page)] for name, pattern in every.items()},
+    )
+
+def scanned(page, first, every, rnd):
+    scanner = PageScanner(first=first, every=every)
+    data, pos = page.encode(), 0
+    while pos < len(data):
+        size = rnd.choice([1, 7, 1000, 4096, 64 * 1024, 200 * 1024])
+        scanner.feed(data[pos:pos + size])
+        pos += size
+    scanner.close()
+    return scanner.first, scanner.every
+
+
+class PageScannerTest(unittest.TestCase):
+    '''
+    Fields collected as the page streams in match those found by searching
+    the whole page for each pattern.
+    '''
+
+    def test_provider_pages(self):
+        rnd = random.Random(12)
+        for provider, (first, every) in fixtures.PROVIDER_SCANS.items():
+            for size in (2000, 50 * 1024, 300 * 1024):
+                for _ in range(5):
+                    page = fixtures.provider_page(rnd, provider, size)
+                    with self.subTest(provider=provider, size=size):
+                        self.assertEqual(scanned(page, first, every, rnd), searched(page, first, every))
+
+    def test_recorded_pages(self):
+        rnd = random.Random(12)
+        for provider, (first, every) in fixtures.PROVIDER_SCANS.items():
+            page = fixtures.recorded_provider_page(provider)
+            with self.subTest(provider=provider):
+                self.assertEqual(scanned(page, first, every, rnd), searched(page, first, every))
+
+    def test_match_across_chunks(self):
+        first, every = fixtures.PROVIDER_SCANS['youtube_video']
+        field = '<link itemprop="name" content="Channel">'
+        page = 'x' * (PageScanner.SCAN_SIZE - 10) + field + 'y' * 100
+        scanner = PageScanner(first=first, every=every)
+        for pos in range(0, len(page), PageScanner.SCAN_SIZE):
+            scanner.feed(page[pos:pos + PageScanner.SCAN_SIZE].encode())
+        scanner.close()
+        self.assertEqual(scanner.first['artist'], {'artist': 'Channel'})
+
+    def test_until(self):
+        first, every = fixtures.PROVIDER_SCANS['youtube_video']
+        scanner = PageScanner(first=first, until=['artist'])
+        self.assertFalse(scanner.feed(b'x' * PageScanner.SCAN_SIZE))
+        self.assertTrue(scanner.feed(b'<link itemprop="name" content="Channel">' + b'x' * PageScanner.SCAN_SIZE))
+
+
+if __name__ == '__main__':
+    unittest.main()
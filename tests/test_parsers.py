@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+
+from resources.lib import clock, scraper
+from resources.lib.scraper import CardScanner, Scraper
+from tests import fixtures
+
+
+@unittest.skipUnless(scraper.bs4.builder.builder_registry.lookup('lxml'), 'lxml is not installed')
+class ParserParityTest(unittest.TestCase):
+    '''
+    Every scraper reads the same result from the lxml tree as from the
+    html.parser one.
+    '''
+
+    def assertParity(self, route):
+        with clock.snapshot():
+            with fixtures.recorded('html.parser'):
+                expected = Scraper.call(route)
+            with fixtures.recorded('lxml'):
+                self.assertEqual(Scraper.call(route), expected)
+
+    def test_routes(self):
+        for route in fixtures.ROUTES:
+            with self.subTest(route=route):
+                self.assertParity(route)
+
+    def test_card_routes_without_scanner(self):
+        with mock.patch.object(CardScanner, 'scan', return_value=None):
+            for route in fixtures.CARD_ROUTES:
+                with self.subTest(route=route):
+                    self.assertParity(route)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from resources.lib.scraper import Listing, OnDemandSegmentsScraper, Scraper, UnmatchedResourcePath, UnmatchedWebsitePath
+from tests import fixtures
+
+
+class RoutesTest(unittest.TestCase):
+    '''
+    Paths are routed to the same scraper and path values as when each
+    scraper was tried in turn.
+    '''
+
+    def test_resource_paths(self):
+        for path in fixtures.route_paths('RESOURCE_PATH_PATTERN'):
+            with self.subTest(path=path):
+                route = fixtures.linear_route('RESOURCE_PATH_PATTERN', path)
+                if route:
+                    scraper = Scraper.find_by_resource_path(path)
+                    self.assertEqual((type(scraper), scraper.groupdict), route)
+                else:
+                    self.assertRaises(UnmatchedResourcePath, Scraper.find_by_resource_path, path)
+
+    def test_website_paths(self):
+        for path in fixtures.route_paths('WEBSITE_PATH_PATTERN'):
+            with self.subTest(path=path):
+                route = fixtures.linear_route('WEBSITE_PATH_PATTERN', path)
+                if route:
+                    self.assertEqual(Scraper.match_website_route(path), route)
+                    scraper, groupdict = route
+                    self.assertEqual(Scraper.resource_path_for(path), scraper.RESOURCE_PATH_PATTERN.format_map(groupdict))
+                else:
+                    self.assertRaises(UnmatchedWebsitePath, Scraper.resource_path_for, path)
+
+    def test_unmatched_website_path_in_listing(self):
+        # raised from inside stream(), where a StopIteration would become a RuntimeError
+        scraper = OnDemandSegmentsScraper('/segments')
+        def stream():
+            yield Scraper.resource_path_for('/nope')
+        scraper.stream = stream
+        with fixtures.recorded():
+            with self.assertRaises(UnmatchedWebsitePath):
+                list(Listing(scraper))
+
+
+if __name__ == '__main__':
+    unittest.main()